@@ -1,8 +1,15 @@
-from .analyzers.statistics import StatisticalAnalyzer
-from .benchmarks.async_bench import AsyncBenchmark
+import os
+
+# Persist compiled numba kernels somewhere writable so each process start
+# loads them from disk instead of recompiling (must be set before numba loads)
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", os.path.expanduser("~/.cache/pgbenchmark/numba")
+)
+
+import importlib
+
 from .benchmarks.parallel import ParallelBenchmark
 from .benchmarks.single import SingleThreadBenchmark
-from .benchmarks.stress import StressBenchmark
 from .core.base import BenchmarkConfig
 from .core.connection import ConnectionManager
 from .core.metrics import BenchmarkResult, QueryExecution
@@ -26,6 +33,26 @@ __all__ = [
     # "ReportGenerator",
 ]
 
+# Heavy dependencies (scipy/numpy/numba, asyncpg, psutil) load on first use
+_LAZY_ATTRS = {
+    "StatisticalAnalyzer": ".analyzers.statistics",
+    "AsyncBenchmark": ".benchmarks.async_bench",
+    "StressBenchmark": ".benchmarks.stress",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 # Convenience function for quick benchmarking
 def quick_benchmark(sql, connection_params=None, runs=100):
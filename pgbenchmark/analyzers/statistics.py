@@ -1,7 +1,10 @@
 """Statistical analysis for benchmark results."""
 
+import functools
 import math
 import statistics
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -10,6 +13,198 @@ from scipy import stats
 
 from ..core.metrics import BenchmarkResult, QueryExecution
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    njit = None
+
+# Shapiro-Wilk p-values are unreliable above this many samples
+_NORMALITY_MAX_SAMPLES = 5000
+
+
+@functools.lru_cache(maxsize=256)
+def _critical_value(confidence: float, df: Optional[int]) -> float:
+    """Two-sided critical value: normal if ``df`` is None, else Student's t."""
+    if df is None:
+        return float(stats.norm.ppf((1 + confidence) / 2))
+    return float(stats.t.ppf((1 + confidence) / 2, df))
+
+
+def _quantile_sorted(sorted_data: np.ndarray, q: float) -> float:
+    """Linearly interpolated quantile of an already sorted array."""
+    pos = q * (len(sorted_data) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_data) - 1)
+    return sorted_data[lo] + (sorted_data[hi] - sorted_data[lo]) * (pos - lo)
+
+
+def _mad_sorted(sorted_data: np.ndarray, median: float) -> float:
+    """
+    Median absolute deviation of a sorted array without a second sort.
+
+    ``|sorted_data - median|`` decreases up to the median and increases after
+    it, so walking outwards from the median with two pointers yields the
+    deviations in ascending order; we stop as soon as the middle is reached.
+    """
+    n = len(sorted_data)
+    left = np.searchsorted(sorted_data, median) - 1
+    right = left + 1
+    lo_idx = (n - 1) // 2
+    lo_val = 0.0
+    d = 0.0
+    for pos in range(n // 2 + 1):
+        if right >= n or (
+            left >= 0 and median - sorted_data[left] <= sorted_data[right] - median
+        ):
+            d = median - sorted_data[left]
+            left -= 1
+        else:
+            d = sorted_data[right] - median
+            right += 1
+        if pos == lo_idx:
+            lo_val = d
+    return (lo_val + d) / 2
+
+
+def _mode_sorted(sorted_data: np.ndarray):
+    """Smallest most frequent value of a sorted array as (value, count)."""
+    best_val = sorted_data[0]
+    best_count = 1
+    run_count = 1
+    for i in range(1, len(sorted_data)):
+        if sorted_data[i] == sorted_data[i - 1]:
+            run_count += 1
+        else:
+            run_count = 1
+        if run_count > best_count:
+            best_count = run_count
+            best_val = sorted_data[i]
+    return best_val, best_count
+
+
+def _mode_sorted_np(sorted_data: np.ndarray):
+    """NumPy fallback for ``_mode_sorted`` when numba is not installed."""
+    values, counts = np.unique(sorted_data, return_counts=True)
+    idx = int(np.argmax(counts))
+    return values[idx], int(counts[idx])
+
+
+def _summary_kernel_py(sorted_data: np.ndarray):
+    """
+    Compute the core summary of a sorted sample in as few passes as possible.
+
+    Returns:
+        Tuple of (mean, m2, q1, median, q3, mad, n_low, hi_start, min, max)
+        where ``m2`` is the sum of squared deviations, ``sorted_data[:n_low]``
+        are the low IQR outliers and ``sorted_data[hi_start:]`` the high ones.
+    """
+    n = len(sorted_data)
+
+    # Welford's online mean / variance
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = sorted_data[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+
+    q1 = _quantile_sorted(sorted_data, 0.25)
+    median = _quantile_sorted(sorted_data, 0.5)
+    q3 = _quantile_sorted(sorted_data, 0.75)
+
+    mad = _mad_sorted(sorted_data, median)
+
+    # Outliers sit at both ends of the sorted array
+    iqr = q3 - q1
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+    n_low = 0
+    while n_low < n and sorted_data[n_low] < lower_bound:
+        n_low += 1
+    hi_start = n
+    while hi_start > n_low and sorted_data[hi_start - 1] > upper_bound:
+        hi_start -= 1
+
+    return (
+        mean,
+        m2,
+        q1,
+        median,
+        q3,
+        mad,
+        n_low,
+        hi_start,
+        sorted_data[0],
+        sorted_data[n - 1],
+    )
+
+
+def _summary_kernel_np(sorted_data: np.ndarray):
+    """NumPy fallback for ``_summary_kernel`` when numba is not installed."""
+    n = len(sorted_data)
+    mean = sorted_data.mean()
+    m2 = float(np.square(sorted_data - mean).sum())
+    q1, median, q3 = np.percentile(sorted_data, [25, 50, 75])
+    mad = np.median(np.abs(sorted_data - median))
+    iqr = q3 - q1
+    n_low = int(np.searchsorted(sorted_data, q1 - 1.5 * iqr, side="left"))
+    hi_start = max(
+        n_low, int(np.searchsorted(sorted_data, q3 + 1.5 * iqr, side="right"))
+    )
+    return (
+        float(mean),
+        m2,
+        float(q1),
+        float(median),
+        float(q3),
+        float(mad),
+        n_low,
+        hi_start,
+        sorted_data[0],
+        sorted_data[n - 1],
+    )
+
+
+if njit is not None:
+    _jit = njit(cache=True, fastmath=True, boundscheck=False)
+    _quantile_sorted = _jit(_quantile_sorted)
+    _mad_sorted = _jit(_mad_sorted)
+    _mode_sorted = njit(cache=True, boundscheck=False)(_mode_sorted)
+    _summary_kernel = _jit(_summary_kernel_py)
+    # Compile (or load from cache) at import so analyze() never pays for it
+    _summary_kernel(np.zeros(2))
+    _mode_sorted(np.zeros(2))
+else:
+    _mode_sorted = _mode_sorted_np
+    _summary_kernel = _summary_kernel_np
+
+
+_background_executor: Optional[Executor] = None
+_background_lock = threading.Lock()
+
+
+def _warmup_kernels():
+    """Load the compiled kernels in a worker before its first task."""
+    _summary_kernel(np.zeros(2))
+    _mode_sorted(np.zeros(2))
+
+
+def _get_background_executor() -> Executor:
+    """Return the shared executor used by ``analyze_in_background``."""
+    global _background_executor
+    with _background_lock:
+        if _background_executor is None:
+            if njit is not None:
+                # A separate process keeps JIT loading and number crunching
+                # off the interpreter that is driving the benchmark
+                _background_executor = ProcessPoolExecutor(
+                    max_workers=1, initializer=_warmup_kernels
+                )
+            else:
+                _background_executor = ThreadPoolExecutor(max_workers=1)
+        return _background_executor
+
 
 @dataclass
 class StatisticalSummary:
@@ -45,48 +240,68 @@ class StatisticalAnalyzer:
         Returns:
             Statistical summary
         """
-        # Extract successful execution times
-        durations = [e.duration_ms for e in result.executions if e.success]
+        if not result.executions and result.streaming_stats is not None:
+            # Executions were not kept; analyze the reservoir sample instead
+            data = np.array(result.streaming_stats.samples, dtype=np.float64)
+        elif result.durations_ns is not None:
+            # Columnar storage: one boolean mask instead of an object walk
+            durations = np.frombuffer(result.durations_ns, dtype=np.int64)
+            success = np.frombuffer(result.success_mask, dtype=np.bool_)
+            data = durations[success] / 1e6
+            del durations, success  # release the buffer exports
+        else:
+            # successful_runs is caller-supplied and may not match the
+            # executions, so let NumPy size the buffer from the data itself
+            data = np.fromiter(
+                (e.duration_ms for e in result.executions if e.success),
+                dtype=np.float64,
+            )
 
-        if len(durations) < 2:
+        if len(data) < 2:
             raise ValueError(
                 "Need at least 2 successful executions for statistical analysis"
             )
 
-        # Convert to numpy array for easier computation
-        data = np.array(durations)
+        sorted_data = np.sort(data)
+        (
+            mean,
+            m2,
+            q1,
+            median,
+            q3,
+            mad,
+            n_low,
+            hi_start,
+            _min,
+            _max,
+        ) = _summary_kernel(sorted_data)
 
-        # Basic statistics
-        mean = np.mean(data)
-        median = np.median(data)
-        std_dev = np.std(data, ddof=1)  # Sample standard deviation
-        variance = np.var(data, ddof=1)
+        # Basic statistics (sample variance)
+        variance = m2 / (len(data) - 1)
+        std_dev = math.sqrt(variance)
 
-        # Mode (might not exist or might be multiple)
-        try:
-            mode_result = stats.mode(data, keepdims=True)
-            mode = float(mode_result.mode[0]) if mode_result.count[0] > 1 else None
-        except:
-            mode = None
+        # Mode: longest run of equal values in the sorted data
+        mode_value, mode_count = _mode_sorted(sorted_data)
+        mode = float(mode_value) if mode_count > 1 else None
 
         # Skewness and Kurtosis
         skewness = stats.skew(data)
         kurtosis = stats.kurtosis(data)
 
         # Confidence intervals
-        ci_95 = StatisticalAnalyzer._confidence_interval(data, 0.95)
-        ci_99 = StatisticalAnalyzer._confidence_interval(data, 0.99)
+        n = len(data)
+        ci_95 = StatisticalAnalyzer._confidence_interval(mean, std_dev, n, 0.95)
+        ci_99 = StatisticalAnalyzer._confidence_interval(mean, std_dev, n, 0.99)
 
-        # IQR and MAD
-        q1, q3 = np.percentile(data, [25, 75])
         iqr = q3 - q1
-        mad = np.median(np.abs(data - median))
 
         # Coefficient of variation
         cv = (std_dev / mean) if mean != 0 else float("inf")
 
-        # Detect outliers using IQR method
-        outliers = StatisticalAnalyzer._detect_outliers_iqr(data, q1, q3, iqr)
+        # Outliers (IQR method) are the two tails of the sorted array
+        outliers = np.concatenate(
+            (sorted_data[:n_low], sorted_data[hi_start:])
+        ).tolist()
 
         # Normality test (Shapiro-Wilk)
         normality_test = StatisticalAnalyzer._test_normality(data)
@@ -108,23 +323,51 @@ class StatisticalAnalyzer:
             normality_test=normality_test,
         )
 
+    @staticmethod
+    def analyze_in_background(
+        result: BenchmarkResult, executor: Optional[Executor] = None
+    ) -> "Future[StatisticalSummary]":
+        """
+        Run ``analyze`` on a worker and return a future for the summary.
+
+        Args:
+            result: Benchmark result to analyze
+            executor: Executor to submit to; defaults to a shared worker
+
+        Returns:
+            Future resolving to the statistical summary
+        """
+        executor = executor or _get_background_executor()
+        return executor.submit(StatisticalAnalyzer.analyze, result)
+
     @staticmethod
     def _confidence_interval(
-        data: np.ndarray, confidence: float
+        mean: float, std_dev: float, n: int, confidence: float
     ) -> Tuple[float, float]:
         """Calculate confidence interval."""
-        mean = np.mean(data)
-        sem = stats.sem(data)  # Standard error of the mean
+        sem = std_dev / math.sqrt(n)  # Standard error of the mean
 
-        # Calculate critical value
-        n = len(data)
-        if n >= 30:
-            # Use normal distribution for large samples
-            z = stats.norm.ppf((1 + confidence) / 2)
-            margin = z * sem
-        else:
-            # Use t-distribution for small samples
-            t = stats.t.ppf((1 + confidence) / 2, n - 1)
-            margin = t * sem
+        # Normal distribution for large samples, t-distribution for small ones
+        margin = _critical_value(confidence, None if n >= 30 else n - 1) * sem
 
         return (mean - margin, mean + margin)
+
+    @staticmethod
+    def _test_normality(data: np.ndarray) -> Dict[str, Any]:
+        """Run a Shapiro-Wilk normality test."""
+        if len(data) < 3:
+            return {"test": "shapiro", "statistic": None, "p_value": None}
+
+        # Subsample across the whole run (seeded, so results reproduce)
+        # rather than taking the first rows, which warm-up iterations dominate
+        sample = data
+        if len(data) > _NORMALITY_MAX_SAMPLES:
+            rng = np.random.default_rng(0)
+            sample = rng.choice(data, _NORMALITY_MAX_SAMPLES, replace=False)
+        statistic, p_value = stats.shapiro(sample)
+        return {
+            "test": "shapiro",
+            "statistic": float(statistic),
+            "p_value": float(p_value),
+            "is_normal": bool(p_value > 0.05),
+        }
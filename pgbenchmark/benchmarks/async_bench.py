@@ -2,18 +2,89 @@
 
 import asyncio
 import logging
+import queue
+import re
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
 
-from ..core.base import BenchmarkConfig
+from ..core.base import BenchmarkConfig, load_sql
 from ..core.exceptions import BenchmarkError, ConnectionError
 from ..core.metrics import BenchmarkResult, MetricsCollector, QueryExecution
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+# A single-quoted string literal, or a {name} placeholder outside one
+_LITERAL_OR_PLACEHOLDER_RE = re.compile(r"'(?:[^']|'')*'|\{(\w+)\}")
+
+# SQLSTATE classes that fail the same way on every attempt: syntax/access
+# rules, unsupported features, auth, invalid catalog/schema names
+_NON_RETRYABLE_SQLSTATE_CLASSES = frozenset({"42", "0A", "28", "3D", "3F"})
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _to_positional(sql: str, params: Dict[str, Any]) -> Tuple[str, tuple]:
+    """
+    Rewrite ``{name}`` placeholders into asyncpg ``$n`` parameters.
+
+    Returns the rewritten SQL and the positional arguments in ``$n`` order.
+    Placeholders without a matching parameter are left untouched. A quoted
+    ``'{name}'`` literal becomes ``$n`` bound to ``str(value)``, matching the
+    text the old substitution produced. Placeholders embedded in a longer
+    literal (``'%{name}%'``) cannot be bound, so they are substituted as text.
+    """
+    positions: Dict[Tuple[str, bool], int] = {}
+    inlined: List[str] = []
+
+    def _bind(key: str, as_text: bool) -> str:
+        slot = (key, as_text)
+        if slot not in positions:
+            positions[slot] = len(positions) + 1
+        return f"${positions[slot]}"
+
+    def _inline(match):
+        key = match.group(1)
+        if key not in params:
+            return match.group(0)
+        inlined.append(key)
+        return str(params[key]).replace("'", "''")
+
+    def _replace(match):
+        key = match.group(1)
+        if key is not None:
+            return _bind(key, False) if key in params else match.group(0)
+        literal = match.group(0)
+        quoted = _PLACEHOLDER_RE.fullmatch(literal[1:-1])
+        if quoted and quoted.group(1) in params:
+            return _bind(quoted.group(1), True)
+        return _PLACEHOLDER_RE.sub(_inline, literal)
+
+    rewritten = _LITERAL_OR_PLACEHOLDER_RE.sub(_replace, sql)
+    if inlined:
+        logger.warning(
+            "Placeholders inside string literals were substituted as text, "
+            f"not bound: {sorted(set(inlined))}"
+        )
+    args = tuple(
+        str(params[key]) if as_text else params[key] for key, as_text in positions
+    )
+    return rewritten, args
+
 
 class AsyncBenchmark:
     """Asynchronous benchmark using asyncpg."""
@@ -31,48 +102,93 @@ class AsyncBenchmark:
         self.concurrency = concurrency
         self._sql_query: Optional[str] = None
         self._sql_params: Optional[dict] = None
+        self._sql_positional: Optional[str] = None
+        self._positional_args: tuple = ()
         self._pool: Optional[asyncpg.Pool] = None
         self._is_running = False
+        self._wall0: Optional[datetime] = None
+        self._perf0 = 0
 
     def _convert_params(self, params: dict) -> dict:
         """Convert psycopg2 params to asyncpg format."""
-        return {
+        converted = {
             "host": params.get("host", "localhost"),
             "port": int(params.get("port", 5432)),
             "user": params.get("user", "postgres"),
             "password": params.get("password", ""),
             "database": params.get("dbname", "postgres"),
         }
+        if params.get("server_settings"):
+            converted["server_settings"] = dict(params["server_settings"])
+        return converted
 
     def set_sql(self, sql: str, params: Optional[dict] = None):
-        """Set the SQL query to benchmark."""
+        """Set the SQL query (or path to a SQL file) to benchmark."""
         if self._is_running:
             raise BenchmarkError("Cannot set SQL while benchmark is running")
-        self._sql_query = sql
+        self._sql_query = load_sql(sql)
         self._sql_params = params or {}
+        self._sql_positional, self._positional_args = _to_positional(
+            self._sql_query, self._sql_params
+        )
 
     async def _create_pool(self):
         """Create connection pool."""
+        # statement_timeout is sent with the startup packet, so it costs no
+        # extra round-trip per query
+        params = dict(self.connection_params)
+        server_settings = dict(params.pop("server_settings", None) or {})
+        if self.config.timeout:
+            server_settings["statement_timeout"] = str(int(self.config.timeout * 1000))
+
         try:
             self._pool = await asyncpg.create_pool(
-                **self.connection_params,
+                **params,
                 min_size=self.concurrency,
                 max_size=self.concurrency * 2,
                 command_timeout=self.config.timeout,
+                server_settings=server_settings,
+                # Never recycle idle connections: the default closes them after
+                # 300s, so a later iteration would time a fresh connect
+                max_inactive_connection_lifetime=0,
             )
+            await self._warm_pool()
             logger.info(f"Created async pool with {self.concurrency} connections")
         except Exception as e:
             raise ConnectionError(f"Failed to create connection pool: {e}")
 
+    async def _warm_pool(self):
+        """Hold ``concurrency`` connections at once and ping each of them.
+
+        This makes sure every connection the benchmark will use is established
+        before timing starts, so warmup runs don't measure connection setup.
+        """
+        connections = []
+        try:
+            for _ in range(self.concurrency):
+                connections.append(await self._pool.acquire())
+            await asyncio.gather(*(conn.execute("SELECT 1") for conn in connections))
+        finally:
+            for conn in connections:
+                await self._pool.release(conn)
+
     async def _close_pool(self):
         """Close connection pool."""
         if self._pool:
             await self._pool.close()
             self._pool = None
 
+    def _mark_time_base(self):
+        """Sample the wall clock once; query timestamps are offsets from it."""
+        self._wall0 = datetime.now()
+        self._perf0 = time.perf_counter_ns()
+
+    def _wall_time(self, perf_ns: int) -> datetime:
+        """Convert a ``time.perf_counter_ns()`` reading into wall-clock time."""
+        return self._wall0 + timedelta(microseconds=(perf_ns - self._perf0) // 1000)
+
     async def _execute_query(self, run_id: int) -> QueryExecution:
         """Execute a single query asynchronously."""
-        start_time = datetime.now()
         success = False
         error = None
 
@@ -80,81 +196,77 @@ class AsyncBenchmark:
         while retry_count <= self.config.retry_on_error:
             try:
                 async with self._pool.acquire() as conn:
-                    # Set timeout if configured
-                    if self.config.timeout:
-                        await conn.execute(
-                            f"SET statement_timeout = {int(self.config.timeout * 1000)}"
-                        )
-
-                    # Execute query
-                    query_start = time.perf_counter()
-
-                    # Format query with parameters if needed
-                    formatted_query = self._format_query()
-
-                    result = await conn.fetch(formatted_query)
-                    query_end = time.perf_counter()
+                    # Bound parameters let asyncpg reuse its cached prepared
+                    # statement instead of re-planning a new query text
+                    query_start = time.perf_counter_ns()
+                    result = await conn.fetch(
+                        self._sql_positional, *self._positional_args
+                    )
+                    query_end = time.perf_counter_ns()
 
                     success = True
                     break
 
             except asyncio.TimeoutError as e:
                 error = f"Query timeout: {e}"
-                query_end = time.perf_counter()
+                query_end = time.perf_counter_ns()
                 query_start = query_end
                 break  # Don't retry on timeout
 
             except asyncpg.PostgresError as e:
                 error = str(e)
                 logger.error(f"Query execution failed (attempt {retry_count + 1}): {e}")
-                query_end = time.perf_counter()
+                query_end = time.perf_counter_ns()
                 query_start = query_end
 
+                sqlstate = getattr(e, "sqlstate", None)
+                if sqlstate and sqlstate[:2] in _NON_RETRYABLE_SQLSTATE_CLASSES:
+                    break  # Retrying cannot succeed
+
                 retry_count += 1
                 if retry_count <= self.config.retry_on_error:
-                    await asyncio.sleep(0.5 * retry_count)
+                    await asyncio.sleep(min(0.05 * 2**retry_count, 1.0))
                 else:
                     break
 
             except Exception as e:
                 error = str(e)
                 logger.error(f"Unexpected error during query execution: {e}")
-                query_end = time.perf_counter()
+                query_end = time.perf_counter_ns()
                 query_start = query_end
                 break
 
-        end_time = datetime.now()
-
         return QueryExecution(
             run_id=run_id,
-            start_time=start_time,
-            end_time=end_time,
-            duration=timedelta(seconds=query_end - query_start),
+            start_time=self._wall_time(query_start),
+            end_time=self._wall_time(query_end),
+            duration_ns=query_end - query_start,
             success=success,
             error=error,
         )
 
-    def _format_query(self) -> str:
-        """Format query with parameters."""
-        # Simple parameter substitution for now
-        query = self._sql_query
-        for key, value in self._sql_params.items():
-            query = query.replace(f"{{{key}}}", str(value))
-        return query
+    def _bounded_tasks(self, run_ids) -> List[asyncio.Task]:
+        """
+        Schedule queries for ``run_ids`` with at most ``concurrency`` in flight.
+
+        A new query starts as soon as any running one finishes, instead of
+        waiting for the slowest query of a fixed-size batch.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _bounded(run_id: int) -> QueryExecution:
+            async with semaphore:
+                return await self._execute_query(run_id)
+
+        return [asyncio.ensure_future(_bounded(run_id)) for run_id in run_ids]
 
     async def _execute_warmup(self):
         """Execute warmup queries."""
         if self.config.warmup_runs > 0:
             logger.info(f"Executing {self.config.warmup_runs} warmup runs")
-
-            warmup_tasks = []
-            for i in range(self.config.warmup_runs):
-                warmup_tasks.append(self._execute_query(run_id=-i - 1))
-
-            # Execute warmup in batches
-            for i in range(0, len(warmup_tasks), self.concurrency):
-                batch = warmup_tasks[i : i + self.concurrency]
-                await asyncio.gather(*batch)
+            await asyncio.gather(
+                *self._bounded_tasks(range(-1, -self.config.warmup_runs - 1, -1))
+            )
 
     async def _run_async(self) -> BenchmarkResult:
         """Run benchmark asynchronously."""
@@ -162,6 +274,7 @@ class AsyncBenchmark:
             raise ValueError("SQL query not set")
 
         self._is_running = True
+        self._mark_time_base()
 
         try:
             await self._create_pool()
@@ -169,39 +282,22 @@ class AsyncBenchmark:
             # Execute warmup
             await self._execute_warmup()
 
-            collector = MetricsCollector()
+            collector = MetricsCollector(
+                keep_executions=self.config.keep_executions
+                or self.config.collect_explain
+            )
             collector.start()
 
             logger.info(
                 f"Executing {self.config.number_of_runs} benchmark runs with concurrency {self.concurrency}"
             )
 
-            # Create all tasks
-            all_executions = []
-
-            # Execute in batches to control concurrency
-            for batch_start in range(0, self.config.number_of_runs, self.concurrency):
-                batch_end = min(
-                    batch_start + self.concurrency, self.config.number_of_runs
-                )
-                batch_tasks = [
-                    self._execute_query(run_id)
-                    for run_id in range(batch_start, batch_end)
-                ]
-
-                # Execute batch
-                batch_results = await asyncio.gather(*batch_tasks)
-
-                # Add to collector
-                for execution in batch_results:
-                    collector.add_execution(execution)
-                    all_executions.append(execution)
-
-                # Log progress
-                if (batch_end) % 100 == 0:
-                    logger.info(
-                        f"Completed {batch_end}/{self.config.number_of_runs} runs"
-                    )
+            executions = await asyncio.gather(
+                *self._bounded_tasks(range(self.config.number_of_runs))
+            )
+
+            for execution in executions:
+                collector.add_execution(execution)
 
             collector.end()
 
@@ -217,6 +313,7 @@ class AsyncBenchmark:
             raise ValueError("SQL query not set")
 
         self._is_running = True
+        self._mark_time_base()
 
         try:
             await self._create_pool()
@@ -226,22 +323,14 @@ class AsyncBenchmark:
 
             logger.info(f"Executing {self.config.number_of_runs} benchmark runs")
 
-            # Execute and yield results
-            for batch_start in range(0, self.config.number_of_runs, self.concurrency):
-                batch_end = min(
-                    batch_start + self.concurrency, self.config.number_of_runs
-                )
-                batch_tasks = [
-                    self._execute_query(run_id)
-                    for run_id in range(batch_start, batch_end)
-                ]
-
-                # Execute batch
-                batch_results = await asyncio.gather(*batch_tasks)
-
-                # Yield results
-                for execution in batch_results:
-                    yield execution
+            # Yield results in completion order
+            tasks = self._bounded_tasks(range(self.config.number_of_runs))
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
 
         finally:
             await self._close_pool()
@@ -249,31 +338,81 @@ class AsyncBenchmark:
 
     def run(self) -> BenchmarkResult:
         """Execute the async benchmark."""
-        return asyncio.run(self._run_async())
+        loop = _new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(self._run_async())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            asyncio.set_event_loop(None)
+            loop.close()
 
-    def iter_results(self):
-        """Synchronous wrapper for async iteration."""
+    async def aiter_results(self):
+        """Asynchronously iterate over results as they complete."""
+        async for execution in self._iter_async():
+            yield execution
 
-        async def _collect():
-            async for execution in self._iter_async():
-                results.append(execution)
-                yield execution
+    def iter_results(self):
+        """
+        Synchronous iteration over results as they complete.
+
+        The benchmark runs at full concurrency on an event loop in a background
+        thread and hands executions over through a bounded queue, so a slow
+        consumer applies back-pressure without serializing the queries.
+        """
+        results: queue.Queue = queue.Queue(maxsize=self.concurrency * 2)
+        stop = threading.Event()
+
+        def _put(item):
+            # Give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        async def _produce():
+            loop = asyncio.get_running_loop()
+            executions = self._iter_async()
+            try:
+                async for execution in executions:
+                    try:
+                        results.put_nowait(execution)
+                    except queue.Full:
+                        # Wait off-loop so in-flight queries keep completing
+                        await loop.run_in_executor(None, _put, execution)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                await loop.run_in_executor(None, _put, e)
+            finally:
+                await executions.aclose()
+                await loop.run_in_executor(None, _put, None)
+
+        def _run():
+            loop = _new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(_produce())
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
 
-        # This is a simplified version - in production you might want
-        # to use async generators properly
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        producer = threading.Thread(target=_run, daemon=True)
+        producer.start()
 
         try:
-            gen = _collect()
             while True:
-                try:
-                    execution = loop.run_until_complete(gen.__anext__())
-                    yield execution
-                except StopAsyncIteration:
+                item = results.get()
+                if item is None:
                     break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
         finally:
-            loop.close()
+            stop.set()
+            producer.join()
 
     def get_status(self) -> Dict[str, Any]:
         """Get current benchmark status."""
@@ -1,32 +1,83 @@
 """Parallel benchmark implementation using multiprocessing."""
 
+import functools
+import itertools
 import logging
 import multiprocessing as mp
+import pickle
 import queue
+import threading
 import time
-from functools import partial
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import replace
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
-from ..core.base import BenchmarkConfig
+from ..core.base import BenchmarkConfig, load_sql
 from ..core.connection import ConnectionManager
 from ..core.exceptions import BenchmarkError
-from ..core.metrics import BenchmarkResult, MetricsCollector, QueryExecution
+from ..core.metrics import (
+    BenchmarkResult,
+    MetricsCollector,
+    QueryExecution,
+    pack_executions,
+)
 from .single import SingleThreadBenchmark
 
 logger = logging.getLogger(__name__)
 
+# Executions per result message; one pickle + write per batch
+_RESULT_BATCH_SIZE = 16
+
+_BACKENDS = ("process", "thread")
+
+
+WorkItem = Tuple[int, int, int, int]  # process_id, runs, warmup_runs, run_offset
+WorkDistribution = Tuple[WorkItem, ...]
+
+
+@functools.lru_cache(maxsize=4)
+def _distribute_work(
+    number_of_runs: int, num_processes: int, warmup_runs: int
+) -> WorkDistribution:
+    """Split runs and warmup runs as evenly as possible across processes."""
+    runs_per_process, remainder = divmod(number_of_runs, num_processes)
+    warmup_per_process, warmup_remainder = divmod(warmup_runs, num_processes)
+
+    work_distribution = []
+    run_offset = 0
+
+    for i in range(num_processes):
+        process_runs = runs_per_process + (1 if i < remainder else 0)
+        process_warmup = warmup_per_process + (1 if i < warmup_remainder else 0)
+
+        work_distribution.append((i, process_runs, process_warmup, run_offset))
+        run_offset += process_runs
+
+    return tuple(work_distribution)
+
 
 class ParallelBenchmark:
-    """Parallel benchmark using multiple processes."""
+    """Parallel benchmark using multiple processes or threads."""
 
     def __init__(
         self,
         connection_params: dict,
         num_processes: int = 4,
         config: Optional[BenchmarkConfig] = None,
+        backend: str = "process",
     ):
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend must be one of {_BACKENDS}, got {backend!r}")
         self.connection_params = connection_params
-        self.num_processes = min(num_processes, mp.cpu_count())
+        # psycopg2 releases the GIL while waiting on the server, so threads
+        # keep up with processes for server-bound queries and skip the
+        # fork/pickle cost; client-side CPU work still serialises on the GIL
+        self.backend = backend
+        if backend == "process":
+            num_processes = min(num_processes, mp.cpu_count())
+        self.num_processes = num_processes
         self.config = config or BenchmarkConfig()
         self.config.validate()
 
@@ -35,10 +86,10 @@ class ParallelBenchmark:
         self._is_running = False
 
     def set_sql(self, sql: str, params: Optional[dict] = None):
-        """Set the SQL query to benchmark."""
+        """Set the SQL query (or path to a SQL file) to benchmark."""
         if self._is_running:
             raise BenchmarkError("Cannot set SQL while benchmark is running")
-        self._sql_query = sql
+        self._sql_query = load_sql(sql)
         self._sql_params = params or {}
 
     def run(self) -> BenchmarkResult:
@@ -56,17 +107,31 @@ class ParallelBenchmark:
                 f"Starting parallel benchmark with {self.num_processes} processes"
             )
 
-            # Execute in parallel
-            with mp.Pool(processes=self.num_processes) as pool:
-                worker_func = partial(
-                    self._worker_function,
-                    connection_params=self.connection_params,
-                    sql_query=self._sql_query,
-                    sql_params=self._sql_params,
-                    config=self.config,
-                )
-
-                results = pool.map(worker_func, work_distribution)
+            # Execute in parallel: one task per worker, so submit directly
+            # rather than going through Pool.map's chunking machinery
+            executor_class = (
+                ProcessPoolExecutor if self.backend == "process" else ThreadPoolExecutor
+            )
+            shared = (
+                self.connection_params,
+                self._sql_query,
+                self._sql_params,
+                self.config,
+            )
+            if self.backend == "process":
+                # Pickle the arguments every worker shares once, rather than
+                # once per submitted task
+                worker = self._worker_from_payload
+                shared = (pickle.dumps(shared, pickle.HIGHEST_PROTOCOL),)
+            else:
+                worker = self._worker_function
+
+            with executor_class(max_workers=self.num_processes) as executor:
+                futures = [
+                    executor.submit(worker, work_item, *shared)
+                    for work_item in work_distribution
+                ]
+                results = [future.result() for future in as_completed(futures)]
 
             # Combine results
             return self._combine_results(results)
@@ -82,84 +147,148 @@ class ParallelBenchmark:
         self._is_running = True
 
         try:
-            # Create a queue for results
-            result_queue = mp.Queue()
-
             # Divide work among processes
             work_distribution = self._calculate_work_distribution()
 
+            stream = (
+                self._stream_from_processes
+                if self.backend == "process"
+                else self._stream_from_threads
+            )
+
+            # Collect results as they come in
+            all_executions = []
+            with closing(stream(work_distribution)) as batches:
+                for batch in batches:
+                    all_executions.extend(batch)
+                    yield from batch
+
+            # Create final result
+            return self._create_result_from_executions(all_executions)
+
+        finally:
+            self._is_running = False
+
+    def _stream_from_processes(
+        self, work_distribution: WorkDistribution
+    ) -> Generator[List[QueryExecution], None, None]:
+        """Run workers as processes and yield their result batches."""
+        # One one-way pipe per worker: a single producer and consumer per
+        # channel needs none of mp.Queue's feeder thread, lock or semaphore
+        result_conns = []
+        processes = []
+
+        try:
             # Start worker processes
-            processes = []
             for work_item in work_distribution:
+                reader, writer = mp.Pipe(duplex=False)
                 p = mp.Process(
-                    target=self._worker_with_queue,
+                    target=self._worker_with_pipe,
                     args=(
                         work_item,
                         self.connection_params,
                         self._sql_query,
                         self._sql_params,
                         self.config,
-                        result_queue,
+                        writer,
                     ),
                 )
                 p.start()
+                # Only the worker may hold the write end, so that its exit
+                # (or crash) shows up here as EOF
+                writer.close()
                 processes.append(p)
+                result_conns.append(reader)
+
+            pending = list(result_conns)
+            while pending:
+                for conn in wait(pending):
+                    try:
+                        batch = conn.recv()
+                    except EOFError:
+                        pending.remove(conn)
+                        continue
+                    yield batch
 
-            # Collect results as they come in
-            all_executions = []
-            total_expected = self.config.number_of_runs
-
-            while len(all_executions) < total_expected:
-                try:
-                    execution = result_queue.get(timeout=1)
-                    if execution is not None:
-                        all_executions.append(execution)
-                        yield execution
-                except queue.Empty:
-                    # Check if all processes are still alive
-                    if not any(p.is_alive() for p in processes):
-                        break
-
-            # Wait for all processes to complete
+        finally:
+            # Workers outlive an abandoned iteration unless stopped here
             for p in processes:
+                if p.is_alive():
+                    p.terminate()
                 p.join()
+            for conn in result_conns:
+                conn.close()
+
+    def _stream_from_threads(
+        self, work_distribution: WorkDistribution
+    ) -> Generator[List[QueryExecution], None, None]:
+        """Run workers as threads and yield their result batches."""
+        # In-process queue: batches are handed over by reference, unpickled
+        result_queue: "queue.Queue[Optional[List[QueryExecution]]]" = queue.Queue()
+        stop_event = threading.Event()
+
+        def work(work_item):
+            try:
+                self._stream_worker(
+                    work_item,
+                    self.connection_params,
+                    self._sql_query,
+                    self._sql_params,
+                    self.config,
+                    result_queue.put,
+                    stop_event,
+                )
+            finally:
+                result_queue.put(None)  # this worker is done
 
-            # Create final result
-            return self._create_result_from_executions(all_executions)
+        threads = [
+            threading.Thread(target=work, args=(work_item,), daemon=True)
+            for work_item in work_distribution
+        ]
+        for thread in threads:
+            thread.start()
 
+        try:
+            running = len(threads)
+            while running:
+                batch = result_queue.get()
+                if batch is None:
+                    running -= 1
+                else:
+                    yield batch
         finally:
-            self._is_running = False
+            # Threads cannot be killed; ask them to stop after their current run
+            stop_event.set()
+            for thread in threads:
+                thread.join()
 
-    def _calculate_work_distribution(self) -> List[Tuple[int, int, int]]:
+    def _calculate_work_distribution(self) -> WorkDistribution:
         """Calculate how to distribute work among processes."""
-        runs_per_process = self.config.number_of_runs // self.num_processes
-        remainder = self.config.number_of_runs % self.num_processes
-
-        # Calculate warmup distribution
-        warmup_per_process = self.config.warmup_runs // self.num_processes
-        warmup_remainder = self.config.warmup_runs % self.num_processes
-
-        work_distribution = []
-        run_offset = 0
-
-        for i in range(self.num_processes):
-            process_runs = runs_per_process + (1 if i < remainder else 0)
-            process_warmup = warmup_per_process + (1 if i < warmup_remainder else 0)
-
-            work_distribution.append((i, process_runs, process_warmup, run_offset))
-            run_offset += process_runs
+        return _distribute_work(
+            self.config.number_of_runs, self.num_processes, self.config.warmup_runs
+        )
 
-        return work_distribution
+    @staticmethod
+    def _worker_from_payload(
+        work_item: WorkItem, payload: bytes
+    ) -> List[QueryExecution]:
+        """Unpack the pre-pickled shared arguments and run the worker."""
+        return ParallelBenchmark._worker_function(work_item, *pickle.loads(payload))
 
     @staticmethod
     def _worker_function(
-        work_item: Tuple[int, int, int, int],
+        work_item: WorkItem,
         connection_params: dict,
         sql_query: str,
         sql_params: dict,
         config: BenchmarkConfig,
-    ) -> List[QueryExecution]:
-        """Worker function for parallel execution."""
+    ) -> Union[List[QueryExecution], bytes]:
+        """
+        Worker function for parallel execution.
+
+        Returns the executions, or just their packed durations and success
+        flags when the caller is not keeping executions.
+        """
         process_id, num_runs, num_warmup, run_offset = work_item
 
         logger.info(
@@ -170,19 +299,17 @@ class ParallelBenchmark:
         conn_manager = ConnectionManager(connection_params)
 
         # Create single-threaded benchmark
-        local_config = BenchmarkConfig(
-            number_of_runs=num_runs,
-            warmup_runs=num_warmup,
-            timeout=config.timeout,
-            collect_explain=config.collect_explain,
-            collect_buffers=config.collect_buffers,
-            collect_io_timing=config.collect_io_timing,
-            retry_on_error=config.retry_on_error,
-        )
+        local_config = replace(config, number_of_runs=num_runs, warmup_runs=num_warmup)
 
         benchmark = SingleThreadBenchmark(conn_manager, local_config)
         benchmark.set_sql(sql_query, sql_params)
 
+        if not config.keep_executions:
+            packed = pack_executions(benchmark.iter_results())
+            conn_manager.close()
+            logger.info(f"Process {process_id}: Completed {num_runs} runs")
+            return packed
+
         # Collect results
         executions = []
         for execution in benchmark.iter_results():
@@ -197,55 +324,86 @@ class ParallelBenchmark:
         return executions
 
     @staticmethod
-    def _worker_with_queue(
-        work_item: Tuple[int, int, int, int],
+    def _stream_worker(
+        work_item: WorkItem,
         connection_params: dict,
         sql_query: str,
         sql_params: dict,
         config: BenchmarkConfig,
-        result_queue: mp.Queue,
+        send: Callable[[List[QueryExecution]], None],
+        stop_event: Optional[threading.Event] = None,
     ):
-        """Worker function that sends results through a queue."""
+        """Run one worker's share, passing batches of executions to ``send``."""
         process_id, num_runs, num_warmup, run_offset = work_item
+        batch = []
 
         try:
-            # Create connection manager for this process
+            # Create connection manager for this worker
             conn_manager = ConnectionManager(connection_params)
 
             # Create single-threaded benchmark
-            local_config = BenchmarkConfig(
-                number_of_runs=num_runs,
-                warmup_runs=num_warmup,
-                timeout=config.timeout,
-                collect_explain=config.collect_explain,
-                collect_buffers=config.collect_buffers,
-                collect_io_timing=config.collect_io_timing,
-                retry_on_error=config.retry_on_error,
+            local_config = replace(
+                config, number_of_runs=num_runs, warmup_runs=num_warmup
             )
 
             benchmark = SingleThreadBenchmark(conn_manager, local_config)
             benchmark.set_sql(sql_query, sql_params)
 
-            # Send results through queue as they complete
+            # Send results in small batches as they complete
             for execution in benchmark.iter_results():
                 # Adjust run_id to be globally unique
                 execution.run_id = run_offset + execution.run_id
-                result_queue.put(execution)
+                batch.append(execution)
+                if len(batch) >= _RESULT_BATCH_SIZE:
+                    send(batch)
+                    batch = []
+                if stop_event is not None and stop_event.is_set():
+                    break
 
             conn_manager.close()
 
         except Exception as e:
             logger.error(f"Process {process_id} failed: {e}")
 
-    def _combine_results(self, results: List[List[QueryExecution]]) -> BenchmarkResult:
+        finally:
+            if batch:
+                send(batch)
+
+    @staticmethod
+    def _worker_with_pipe(
+        work_item: WorkItem,
+        connection_params: dict,
+        sql_query: str,
+        sql_params: dict,
+        config: BenchmarkConfig,
+        result_conn: Connection,
+    ):
+        """Worker function that sends results through a pipe."""
+        try:
+            ParallelBenchmark._stream_worker(
+                work_item,
+                connection_params,
+                sql_query,
+                sql_params,
+                config,
+                result_conn.send,
+            )
+        finally:
+            result_conn.close()
+
+    def _combine_results(
+        self, results: List[Union[List[QueryExecution], bytes]]
+    ) -> BenchmarkResult:
         """Combine results from all workers."""
-        collector = MetricsCollector()
+        collector = MetricsCollector(keep_executions=self.config.keep_executions)
         collector.start()
 
-        # Flatten and add all executions
-        for worker_results in results:
-            for execution in worker_results:
-                collector.add_execution(execution)
+        if self.config.keep_executions:
+            # Flatten and add all executions
+            collector.add_executions(itertools.chain.from_iterable(results))
+        else:
+            for packed in results:
+                collector.add_buffer(packed)
 
         collector.end()
         return collector.get_result()
@@ -254,11 +412,10 @@ class ParallelBenchmark:
         self, executions: List[QueryExecution]
     ) -> BenchmarkResult:
         """Create a benchmark result from a list of executions."""
-        collector = MetricsCollector()
+        collector = MetricsCollector(keep_executions=self.config.keep_executions)
         collector.start()
 
-        for execution in executions:
-            collector.add_execution(execution)
+        collector.add_executions(executions)
 
         collector.end()
         return collector.get_result()
@@ -268,6 +425,7 @@ class ParallelBenchmark:
         return {
             "is_running": self._is_running,
             "num_processes": self.num_processes,
+            "backend": self.backend,
             "total_runs": self.config.number_of_runs,
             "sql_query": self._sql_query,
         }
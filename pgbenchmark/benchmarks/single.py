@@ -1,9 +1,10 @@
 """Single-threaded benchmark implementation."""
 
 import logging
+import re
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, Generator, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Optional
 
 import psycopg2
 
@@ -15,6 +16,47 @@ from ..formatters.sql import SQLFormatter
 
 logger = logging.getLogger(__name__)
 
+_BUFFER_STAT_KEYS = ("blks_read", "blks_hit", "tup_returned", "tup_fetched")
+_BUFFER_STATS_SQL = (
+    f"SELECT {', '.join(_BUFFER_STAT_KEYS)} FROM pg_stat_database "
+    "WHERE datname = current_database()"
+)
+
+# EXPLAIN (BUFFERS) counters reported when the plan doubles as buffer source
+_PLAN_BUFFER_KEYS = {
+    "Shared Hit Blocks": "shared_hit_blocks",
+    "Shared Read Blocks": "shared_read_blocks",
+    "Shared Dirtied Blocks": "shared_dirtied_blocks",
+    "Shared Written Blocks": "shared_written_blocks",
+}
+
+# Template globals whose value changes on every render
+_DYNAMIC_TEMPLATE_NAMES = frozenset({"now", "random"})
+
+# Statements PREPARE accepts; anything else runs as plain SQL
+_PREPARABLE_SQL_RE = re.compile(
+    r"\s*(SELECT|INSERT|UPDATE|DELETE|MERGE|VALUES|WITH|TABLE)\b", re.IGNORECASE
+)
+
+
+def _is_preparable(sql: str) -> bool:
+    """Return True if ``sql`` is a single statement PREPARE can take."""
+    return bool(_PREPARABLE_SQL_RE.match(sql)) and ";" not in sql.rstrip("; ")
+
+
+def _plan_buffer_stats(explain_plan) -> Optional[Dict[str, int]]:
+    """
+    Extract shared buffer counters from an EXPLAIN (BUFFERS, FORMAT JSON) plan.
+
+    PostgreSQL reports each node's counters inclusive of its children, so the
+    root node already holds the totals for the whole statement.
+    """
+    try:
+        root = explain_plan[0]["Plan"]
+    except (IndexError, KeyError, TypeError):
+        return None
+    return {key: root.get(field, 0) for field, key in _PLAN_BUFFER_KEYS.items()}
+
 
 class SingleThreadBenchmark(BaseBenchmark):
     """Single-threaded benchmark implementation."""
@@ -27,16 +69,16 @@ class SingleThreadBenchmark(BaseBenchmark):
         super().__init__(connection_manager, config)
         self.sql_formatter = SQLFormatter()
         self._current_run = 0
+        self._static_sql: Optional[str] = None
+        self._statement_name = f"pgbenchmark_{id(self):x}"
+        self._prepare_failed = False
+        self._instrument = False
+        # (connection, cursor) held for the duration of run()/iter_results()
+        self._session = None
 
     def run(self) -> BenchmarkResult:
         """Execute the benchmark synchronously."""
-        if not self._sql_query:
-            raise ValueError("SQL query not set")
-
-        self._is_running = True
-        self.metrics_collector.start()
-
-        try:
+        with self._running():
             # Execute warmup runs
             logger.info(f"Executing {self.config.warmup_runs} warmup runs")
             for i in range(self.config.warmup_runs):
@@ -55,21 +97,12 @@ class SingleThreadBenchmark(BaseBenchmark):
                     logger.info(
                         f"Completed {run_id + 1}/{self.config.number_of_runs} runs"
                     )
-        finally:
-            self._is_running = False
-            self.metrics_collector.end()
 
         return self.metrics_collector.get_result()
 
     def iter_results(self) -> Generator[QueryExecution, None, BenchmarkResult]:
         """Iterate over benchmark results as they complete."""
-        if not self._sql_query:
-            raise ValueError("SQL query not set")
-
-        self._is_running = True
-        self.metrics_collector.start()
-
-        try:
+        with self._running():
             # Execute warmup runs
             logger.info(f"Executing {self.config.warmup_runs} warmup runs")
             for i in range(self.config.warmup_runs):
@@ -83,11 +116,201 @@ class SingleThreadBenchmark(BaseBenchmark):
                 if execution:
                     self.metrics_collector.add_execution(execution)
                     yield execution
+
+        return self.metrics_collector.get_result()
+
+    @contextmanager
+    def session(
+        self,
+    ) -> Generator[Callable[[int], Optional[QueryExecution]], None, None]:
+        """
+        Hold one connection and yield a function that runs the query once.
+
+        For callers that schedule runs themselves, e.g. at a fixed rate. The
+        function takes a run id and returns the execution (None if it was not
+        recorded); executions are not added to ``metrics_collector``, and the
+        configured warmup and run counts are ignored.
+        """
+        with self._running():
+
+            def execute(run_id: int = 0) -> Optional[QueryExecution]:
+                return self._execute_single_query(run_id=run_id)
+
+            yield execute
+
+    @contextmanager
+    def _running(self):
+        """Set up a run, hold its connection, and tear it down afterwards."""
+        if not self._sql_query:
+            raise ValueError("SQL query not set")
+
+        self._is_running = True
+        self.metrics_collector.start()
+        self._prepare_sql()
+
+        try:
+            with self._hold_connection():
+                yield
         finally:
             self._is_running = False
+            self._static_sql = None
             self.metrics_collector.end()
 
-        return self.metrics_collector.get_result()
+    @contextmanager
+    def _hold_connection(self):
+        """Keep one connection and cursor checked out across many runs."""
+        with self.connection_manager.get_connection() as conn:
+            with conn.cursor() as cursor:
+                # One session-level SET instead of a SET LOCAL round-trip
+                # per run; committed so a later rollback cannot undo it
+                if self.config.timeout:
+                    self._set_statement_timeout(conn, cursor)
+                self._session = (conn, cursor)
+                try:
+                    yield
+                finally:
+                    self._session = None
+                    if self.config.timeout and not conn.closed:
+                        self._reset_statement_timeout(conn, cursor)
+
+    def _set_statement_timeout(self, conn, cursor):
+        """Apply the configured timeout to the whole session."""
+        cursor.execute("SET statement_timeout = %s", (int(self.config.timeout * 1000),))
+        conn.commit()
+
+    @staticmethod
+    def _reset_statement_timeout(conn, cursor):
+        """Leave the pooled connection with the server's default timeout."""
+        try:
+            conn.rollback()
+            cursor.execute("RESET statement_timeout")
+            conn.commit()
+        except psycopg2.Error as e:
+            logger.warning(f"Failed to reset statement_timeout: {e}")
+
+    @contextmanager
+    def _cursor(self):
+        """Yield the held (connection, cursor), or check out a fresh pair."""
+        if self._session is None:
+            with self.connection_manager.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    if self.config.timeout:
+                        cursor.execute(
+                            "SET LOCAL statement_timeout = %s",
+                            (int(self.config.timeout * 1000),),
+                        )
+                    yield conn, cursor
+            return
+
+        conn, cursor = self._session
+        try:
+            yield conn, cursor
+        except psycopg2.Error:
+            # A pooled checkin would reset this; the held connection must
+            # leave the aborted transaction itself before the next run
+            conn.rollback()
+            raise
+
+    def _prepare_sql(self):
+        """Render the SQL once if nothing in it can change between runs."""
+        variables = set(self.sql_formatter.get_template_variables(self._sql_query))
+        generated = set(self.sql_formatter.generators) - set(self._sql_params)
+        if variables & (_DYNAMIC_TEMPLATE_NAMES | generated):
+            self._static_sql = None
+        else:
+            self._static_sql = self.sql_formatter.format(
+                self._sql_query, self._sql_params
+            )
+        # Only single statements PREPARE accepts are worth trying
+        self._prepare_failed = self._static_sql is not None and not _is_preparable(
+            self._static_sql
+        )
+        self._instrument = (
+            self.config.collect_explain
+            or self.config.collect_buffers
+            or self.config.collect_io_timing
+        )
+
+    def _prepared_statement(self, conn, cursor) -> Optional[str]:
+        """
+        Return an EXECUTE for the static SQL, preparing it on ``conn`` once.
+
+        Returns None when the SQL has to be sent as-is (prepared statements
+        disabled, SQL rendered per run, or a statement PREPARE rejects).
+        """
+        sql = self._static_sql
+        if not self.config.use_prepared or sql is None or self._prepare_failed:
+            return None
+
+        try:
+            # The connection manager tracks what each session has prepared
+            self.connection_manager.prepare_statement(
+                conn, cursor, self._statement_name, sql
+            )
+        except psycopg2.Error as e:
+            logger.warning(f"Failed to prepare statement, running plain SQL: {e}")
+            conn.rollback()
+            self._prepare_failed = True
+            return None
+
+        return f"EXECUTE {self._statement_name}"
+
+    def _collect_before(self, cursor, formatted_sql: str):
+        """Collect the EXPLAIN plan and starting buffer counters, if enabled."""
+        explain_plan = None
+        initial_buffer_stats = None
+
+        if self.config.collect_explain:
+            try:
+                cursor.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {formatted_sql}"
+                )
+                explain_plan = cursor.fetchone()[0]
+            except psycopg2.Error as e:
+                logger.warning(f"Failed to collect EXPLAIN: {e}")
+
+        # The plan already carries per-statement buffer counters, which beat
+        # a database-wide pg_stat_database delta and cost no extra queries
+        if self.config.collect_buffers and explain_plan is None:
+            cursor.execute(_BUFFER_STATS_SQL)
+            initial_buffer_stats = cursor.fetchone()
+
+        return explain_plan, initial_buffer_stats
+
+    def _collect_after(
+        self, cursor, formatted_sql: str, explain_plan, initial_buffer_stats
+    ):
+        """Collect buffer counter deltas and IO timing, if enabled."""
+        buffer_stats = None
+        io_stats = None
+
+        if self.config.collect_buffers and explain_plan is not None:
+            buffer_stats = _plan_buffer_stats(explain_plan)
+        elif initial_buffer_stats is not None:
+            cursor.execute(_BUFFER_STATS_SQL)
+            final_buffer_stats = cursor.fetchone()
+            if final_buffer_stats is not None:
+                buffer_stats = {
+                    key: final - initial
+                    for key, final, initial in zip(
+                        _BUFFER_STAT_KEYS, final_buffer_stats, initial_buffer_stats
+                    )
+                }
+
+        if self.config.collect_io_timing:
+            cursor.execute(
+                "SELECT * FROM pg_stat_statements WHERE query = %s",
+                (formatted_sql,),
+            )
+            if cursor.rowcount > 0:
+                io_stats = dict(
+                    zip(
+                        [desc[0] for desc in cursor.description],
+                        cursor.fetchone(),
+                    )
+                )
+
+        return buffer_stats, io_stats
 
     def _execute_single_query(
         self, run_id: int = 0, warmup: bool = False, warmup_id: int = 0
@@ -95,7 +318,9 @@ class SingleThreadBenchmark(BaseBenchmark):
         """Execute a single query and measure performance."""
 
         # Format SQL with parameters
-        formatted_sql = self.sql_formatter.format(self._sql_query, self._sql_params)
+        formatted_sql = self._static_sql or self.sql_formatter.format(
+            self._sql_query, self._sql_params
+        )
 
         # Pre-execution hooks
         context = {
@@ -105,128 +330,78 @@ class SingleThreadBenchmark(BaseBenchmark):
         }
         self._execute_hooks(self._pre_hooks, context)
 
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         success = False
         error = None
         explain_plan = None
         buffer_stats = None
         io_stats = None
         retry_count = 0
+        query_start = start_ns
+        # Decided once per benchmark; the plain path skips all collection
+        instrument = self._instrument and not warmup
+        fetch_mode = self.config.fetch_mode
 
         while retry_count <= self.config.retry_on_error:
             try:
-                with self.connection_manager.get_connection() as conn:
-                    with conn.cursor() as cursor:
-                        # Set timeout if configured
-                        if self.config.timeout:
-                            cursor.execute(
-                                "SET LOCAL statement_timeout = %s",
-                                (int(self.config.timeout * 1000),),
-                            )
-                        # Collect EXPLAIN if configured and not warmup
-                        if self.config.collect_explain and not warmup:
-                            try:
-                                cursor.execute(
-                                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {formatted_sql}"
-                                )
-                                explain_plan = cursor.fetchone()[0]
-                            except psycopg2.Error as e:
-                                logger.warning(f"Failed to collect EXPLAIN: {e}")
-
-                        # Collect initial buffer stats if configured
-                        if self.config.collect_buffers and not warmup:
-                            cursor.execute(
-                                "SELECT * FROM pg_stat_database WHERE datname = current_database()"
-                            )
-                            initial_buffer_stats = (
-                                dict(
-                                    zip(
-                                        [desc[0] for desc in cursor.description],
-                                        cursor.fetchone(),
-                                    )
-                                )
-                                if cursor.rowcount > 0
-                                else None
-                            )
-
-                        query_start = time.perf_counter()
-                        cursor.execute(formatted_sql)
-                        query_end = time.perf_counter()
-
-                        # Fetch results to ensure query completion
-                        if cursor.description:
-                            results = cursor.fetchall()
-                            row_count = len(results)
-                        else:
-                            row_count = cursor.rowcount
-
-                        success = True
-
-                        # Collect final buffer stats if configured
-                        if (
-                            self.config.collect_buffers
-                            and not warmup
-                            and initial_buffer_stats
-                        ):
-                            cursor.execute(
-                                "SELECT * FROM pg_stat_database WHERE datname = current_database()"
-                            )
-                            final_buffer_stats = (
-                                dict(
-                                    zip(
-                                        [desc[0] for desc in cursor.description],
-                                        cursor.fetchone(),
-                                    )
-                                )
-                                if cursor.rowcount > 0
-                                else None
-                            )
-
-                            # Calculate buffer stat differences
-                            if final_buffer_stats:
-                                buffer_stats = {
-                                    key: final_buffer_stats.get(key, 0)
-                                    - initial_buffer_stats.get(key, 0)
-                                    for key in [
-                                        "blks_read",
-                                        "blks_hit",
-                                        "tup_returned",
-                                        "tup_fetched",
-                                    ]
-                                    if key in final_buffer_stats
-                                }
-
-                        # Collect IO timing if configured
-                        if self.config.collect_io_timing and not warmup:
-                            cursor.execute(
-                                "SELECT * FROM pg_stat_statements WHERE query = %s",
-                                (formatted_sql,),
-                            )
-                            if cursor.rowcount > 0:
-                                io_stats = dict(
-                                    zip(
-                                        [desc[0] for desc in cursor.description],
-                                        cursor.fetchone(),
-                                    )
-                                )
-
-                        break  # This is a very important break here ;d
+                with self._cursor() as (conn, cursor):
+                    # Parse/plan once per connection, not once per run
+                    statement = self._prepared_statement(conn, cursor) or formatted_sql
+
+                    if instrument:
+                        explain_plan, initial_buffer_stats = self._collect_before(
+                            cursor, formatted_sql
+                        )
+
+                    query_start = time.perf_counter_ns()
+                    cursor.execute(statement)
+                    query_end = time.perf_counter_ns()
+
+                    # psycopg2 has already received every row by now; only
+                    # "all" pays for converting them into Python tuples
+                    if fetch_mode == "all" and cursor.description:
+                        results = cursor.fetchall()
+                        row_count = len(results)
+                    elif fetch_mode != "none":
+                        row_count = cursor.rowcount
+
+                    success = True
+
+                    if instrument:
+                        buffer_stats, io_stats = self._collect_after(
+                            cursor, formatted_sql, explain_plan, initial_buffer_stats
+                        )
+
+                    # End the transaction after the clock has stopped so its
+                    # cost never lands in the measured latency. Reads end it
+                    # too: on the held connection every run would otherwise
+                    # share one transaction, pinning now(), holding locks and
+                    # delaying statistics until the benchmark finishes
+                    if self.config.commit_after_each:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+
+                    break  # This is a very important break here ;d
 
             except psycopg2.extensions.QueryCanceledError as e:
                 error = f"Query timeout: {e}"
                 logger.warning(f"Query timeout on run {run_id}: {e}")
-                query_end = time.perf_counter()
+                query_end = time.perf_counter_ns()
+                break  # Don't retry on timeout
 
         if warmup:
             return None
 
+        end_ns = time.perf_counter_ns()
         return QueryExecution(
             run_id=run_id,
-            start_time=start_time,
-            end_time=datetime.now(),
-            duration=timedelta(seconds=query_end - query_start),
+            start_time=self.metrics_collector.wall_time(start_ns),
+            end_time=self.metrics_collector.wall_time(end_ns),
+            duration_ns=query_end - query_start,
             success=success,
             error=error,
             explain_plan=explain_plan,
             buffer_stats=buffer_stats,
+            io_stats=io_stats,
         )
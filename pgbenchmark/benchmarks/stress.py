@@ -1,15 +1,17 @@
 """Stress testing benchmark implementation."""
 
 import logging
+import os
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import psutil
 
-from ..core.base import BenchmarkConfig
+from ..core.base import BenchmarkConfig, load_sql
 from ..core.connection import ConnectionManager
 from ..core.exceptions import BenchmarkError
 from ..core.metrics import BenchmarkResult, MetricsCollector, QueryExecution
@@ -18,6 +20,132 @@ from .single import SingleThreadBenchmark
 
 logger = logging.getLogger(__name__)
 
+_MB = 1.0 / (1024 * 1024)
+
+# One row per monitor tick; samplers return the fields after "timestamp"
+_RESOURCE_DTYPE = np.dtype(
+    [
+        ("timestamp", "f8"),  # seconds since the epoch
+        ("cpu_percent", "f4"),
+        ("memory_percent", "f4"),
+        ("memory_used_mb", "f8"),
+        ("disk_read_mb", "f8"),
+        ("disk_write_mb", "f8"),
+        ("network_sent_mb", "f8"),
+        ("network_recv_mb", "f8"),
+    ]
+)
+_RESOURCE_LEVELS = ("cpu_percent", "memory_percent", "memory_used_mb")
+_RESOURCE_COUNTERS = (
+    "disk_read_mb",
+    "disk_write_mb",
+    "network_sent_mb",
+    "network_recv_mb",
+)
+
+Sample = Tuple[float, float, float, float, float, float, float]
+
+
+def _psutil_sample() -> Sample:
+    """Sample system-wide resource usage through psutil."""
+    memory = psutil.virtual_memory()
+    disk_io = psutil.disk_io_counters(perdisk=False, nowrap=True)
+    net_io = psutil.net_io_counters(pernic=False, nowrap=True)
+    return (
+        psutil.cpu_percent(interval=None, percpu=False),
+        memory.percent,
+        memory.used * _MB,
+        disk_io.read_bytes * _MB if disk_io else 0,
+        disk_io.write_bytes * _MB if disk_io else 0,
+        net_io.bytes_sent * _MB if net_io else 0,
+        net_io.bytes_recv * _MB if net_io else 0,
+    )
+
+
+class _ProcSampler:
+    """
+    Sample the same figures as ``_psutil_sample`` straight from Linux /proc.
+
+    The four files stay open and are re-read from offset 0 each tick, which
+    avoids psutil's per-call open/parse/namedtuple work when the monitor
+    interval is short.
+    """
+
+    _PATHS = ("/proc/stat", "/proc/meminfo", "/proc/diskstats", "/proc/net/dev")
+
+    @classmethod
+    def available(cls) -> bool:
+        return all(os.access(path, os.R_OK) for path in cls._PATHS)
+
+    def __init__(self):
+        self._files = [open(path, "rb") for path in self._PATHS]
+        # Whole disks only, so partitions are not counted twice
+        self._disks = (
+            {name.encode() for name in os.listdir("/sys/block")}
+            if os.path.isdir("/sys/block")
+            else None
+        )
+        self._cpu_busy = 0
+        self._cpu_total = 0
+
+    def close(self):
+        for f in self._files:
+            f.close()
+
+    def _read(self, index: int) -> bytes:
+        f = self._files[index]
+        f.seek(0)
+        return f.read()
+
+    def __call__(self) -> Sample:
+        return (
+            self._cpu_percent(self._read(0)),
+            *self._memory(self._read(1)),
+            *self._disk(self._read(2)),
+            *self._network(self._read(3)),
+        )
+
+    def _cpu_percent(self, stat: bytes) -> float:
+        # user nice system idle iowait irq softirq steal (guest is in user)
+        fields = [int(v) for v in stat.split(b"\n", 1)[0].split()[1:9]]
+        total = sum(fields)
+        busy = total - fields[3] - fields[4]
+        delta_total = total - self._cpu_total
+        delta_busy = busy - self._cpu_busy
+        self._cpu_total, self._cpu_busy = total, busy
+        # Like psutil.cpu_percent(interval=None, percpu=False): usage since the last call
+        return round(100.0 * delta_busy / delta_total, 1) if delta_total else 0.0
+
+    @staticmethod
+    def _memory(meminfo: bytes) -> Tuple[float, float]:
+        kb = {}
+        for line in meminfo.splitlines():
+            key, value = line.split(b":", 1)
+            kb[key] = int(value.split()[0])
+        total = kb[b"MemTotal"]
+        used = total - kb.get(b"MemAvailable", kb[b"MemFree"])
+        return round(100.0 * used / total, 1), used * 1024 * _MB
+
+    def _disk(self, diskstats: bytes) -> Tuple[float, float]:
+        sectors_read = sectors_written = 0
+        for line in diskstats.splitlines():
+            fields = line.split()
+            if self._disks is not None and fields[2] not in self._disks:
+                continue
+            sectors_read += int(fields[5])
+            sectors_written += int(fields[9])
+        # /proc/diskstats always counts 512-byte sectors
+        return sectors_read * 512 * _MB, sectors_written * 512 * _MB
+
+    @staticmethod
+    def _network(net_dev: bytes) -> Tuple[float, float]:
+        received = sent = 0
+        for line in net_dev.splitlines()[2:]:
+            fields = line.split(b":", 1)[1].split()
+            received += int(fields[0])
+            sent += int(fields[8])
+        return sent * _MB, received * _MB
+
 
 @dataclass
 class StressTestConfig:
@@ -51,14 +179,15 @@ class StressBenchmark:
         self._sql_params: Optional[dict] = None
         self._is_running = False
         self._stop_event = threading.Event()
-        self._resource_data: List[Dict[str, Any]] = []
+        self._resource_data = np.empty(0, dtype=_RESOURCE_DTYPE)
+        self._resource_count = 0
         self._monitor_thread: Optional[threading.Thread] = None
 
     def set_sql(self, sql: str, params: Optional[dict] = None):
-        """Set the SQL query to stress test."""
+        """Set the SQL query (or path to a SQL file) to stress test."""
         if self._is_running:
             raise BenchmarkError("Cannot set SQL while stress test is running")
-        self._sql_query = sql
+        self._sql_query = load_sql(sql)
         self._sql_params = params or {}
 
     def run(self) -> Dict[str, Any]:
@@ -68,7 +197,7 @@ class StressBenchmark:
 
         self._is_running = True
         self._stop_event.clear()
-        self._resource_data = []
+        self._resource_count = 0
 
         try:
             # Start resource monitoring if enabled
@@ -105,80 +234,103 @@ class StressBenchmark:
 
     def _start_resource_monitoring(self):
         """Start monitoring system resources in a separate thread."""
+        sample = _ProcSampler() if _ProcSampler.available() else _psutil_sample
+
+        # Size for the whole test up front; grows only if the test overruns
+        config = self.stress_config
+        expected_seconds = (
+            config.duration_seconds + config.ramp_up_time + config.ramp_down_time
+        )
+        self._resource_data = np.empty(
+            int(expected_seconds / config.monitor_interval) + 1024,
+            dtype=_RESOURCE_DTYPE,
+        )
+        self._resource_count = 0
 
         def monitor():
             while not self._stop_event.is_set():
                 try:
-                    cpu_percent = psutil.cpu_percent(interval=None)
-                    memory = psutil.virtual_memory()
-                    disk_io = psutil.disk_io_counters()
-                    net_io = psutil.net_io_counters()
-
-                    self._resource_data.append(
-                        {
-                            "timestamp": datetime.now(),
-                            "cpu_percent": cpu_percent,
-                            "memory_percent": memory.percent,
-                            "memory_used_mb": memory.used / (1024 * 1024),
-                            "disk_read_mb": disk_io.read_bytes / (1024 * 1024)
-                            if disk_io
-                            else 0,
-                            "disk_write_mb": disk_io.write_bytes / (1024 * 1024)
-                            if disk_io
-                            else 0,
-                            "network_sent_mb": net_io.bytes_sent / (1024 * 1024)
-                            if net_io
-                            else 0,
-                            "network_recv_mb": net_io.bytes_recv / (1024 * 1024)
-                            if net_io
-                            else 0,
-                        }
-                    )
-
-                    time.sleep(self.stress_config.monitor_interval)
+                    row = (time.time(), *sample())
+                    if self._resource_count == len(self._resource_data):
+                        self._resource_data = np.resize(
+                            self._resource_data, 2 * len(self._resource_data)
+                        )
+                    self._resource_data[self._resource_count] = row
+                    self._resource_count += 1
                 except Exception as e:
                     logger.error(f"Resource monitoring error: {e}")
 
+                self._stop_event.wait(self.stress_config.monitor_interval)
+
+            if isinstance(sample, _ProcSampler):
+                sample.close()
+
         self._monitor_thread = threading.Thread(target=monitor, daemon=True)
         self._monitor_thread.start()
         logger.info("Started resource monitoring")
 
+    @property
+    def resource_data(self) -> np.ndarray:
+        """Resource samples recorded so far, one structured row per tick."""
+        return self._resource_data[: self._resource_count]
+
+    def _analyze_resource_data(self) -> Dict[str, Any]:
+        """Summarise the recorded resource samples."""
+        data = self.resource_data
+        if not len(data):
+            return {}
+
+        summary: Dict[str, Any] = {
+            "samples": len(data),
+            "duration_seconds": float(data["timestamp"][-1] - data["timestamp"][0]),
+        }
+        for name in _RESOURCE_LEVELS:
+            values = data[name]
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            summary[name] = {
+                "mean": float(values.mean()),
+                "max": float(values.max()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+        # Cumulative counters: report how much moved during the test
+        for name in _RESOURCE_COUNTERS:
+            summary[name] = float(data[name][-1] - data[name][0])
+        return summary
+
     def _run_sustained_load(self) -> Dict[str, Any]:
         """Run sustained load test at constant QPS."""
         logger.info(
             f"Running sustained load test for {self.stress_config.duration_seconds} seconds"
         )
 
-        # Use parallel benchmark for sustained load
-        parallel_bench = ParallelBenchmark(
-            self.connection_params,
-            num_processes=self.stress_config.concurrent_connections,
-            config=self.benchmark_config,
-        )
-        parallel_bench.set_sql(self._sql_query, self._sql_params)
+        # One connection and benchmark for the whole test: per-iteration
+        # setup would dominate the latency of fast queries
+        conn_manager = ConnectionManager(self.connection_params)
+        single_bench = SingleThreadBenchmark(conn_manager, self.benchmark_config)
+        single_bench.set_sql(self._sql_query, self._sql_params)
 
         start_time = datetime.now()
         executions = []
+        run_id = 0
 
-        # Run for specified duration
-        while (
-            datetime.now() - start_time
-        ).total_seconds() < self.stress_config.duration_seconds:
-            if self.stress_config.target_qps:
-                # Rate limiting to achieve target QPS
-                delay = 1.0 / self.stress_config.target_qps
-                time.sleep(delay)
-
-            # Execute a batch of queries
-            conn_manager = ConnectionManager(self.connection_params)
-            single_bench = SingleThreadBenchmark(conn_manager, self.benchmark_config)
-            single_bench.set_sql(self._sql_query, self._sql_params)
-            single_bench.config.number_of_runs = 1
-            single_bench.config.warmup_runs = 0
-
-            for execution in single_bench.iter_results():
-                executions.append(execution)
-
+        try:
+            with single_bench.session() as execute:
+                # Run for specified duration
+                while (
+                    datetime.now() - start_time
+                ).total_seconds() < self.stress_config.duration_seconds:
+                    if self.stress_config.target_qps:
+                        # Rate limiting to achieve target QPS
+                        delay = 1.0 / self.stress_config.target_qps
+                        time.sleep(delay)
+
+                    execution = execute(run_id)
+                    if execution:
+                        executions.append(execution)
+                    run_id += 1
+        finally:
             conn_manager.close()
 
         end_time = datetime.now()
@@ -5,6 +5,17 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+_ENV_MAPPING = (
+    ("PGBENCH_HOST", "database", "host"),
+    ("PGBENCH_PORT", "database", "port"),
+    ("PGBENCH_DB", "database", "dbname"),
+    ("PGBENCH_USER", "database", "user"),
+    ("PGBENCH_PASSWORD", "database", "password"),
+    ("PGBENCH_RUNS", "benchmark", "default_runs"),
+    ("PGBENCH_WARMUP", "benchmark", "warmup_runs"),
+)
+_INT_KEYS = frozenset({"port", "default_runs", "warmup_runs"})
+
 
 class Config:
     """Global configuration manager."""
@@ -33,7 +44,10 @@ class Config:
     }
 
     def __init__(self, config_file: Optional[str] = None):
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Copy the sections too, so instances never write into DEFAULT_CONFIG
+        self.config = {
+            section: dict(values) for section, values in self.DEFAULT_CONFIG.items()
+        }
 
         # Load from environment variables
         self._load_from_env()
@@ -44,20 +58,11 @@ class Config:
 
     def _load_from_env(self):
         """Load configuration from environment variables."""
-        env_mapping = {
-            "PGBENCH_HOST": ("database", "host"),
-            "PGBENCH_PORT": ("database", "port"),
-            "PGBENCH_DB": ("database", "dbname"),
-            "PGBENCH_USER": ("database", "user"),
-            "PGBENCH_PASSWORD": ("database", "password"),
-            "PGBENCH_RUNS": ("benchmark", "default_runs"),
-            "PGBENCH_WARMUP": ("benchmark", "warmup_runs"),
-        }
-
-        for env_var, (section, key) in env_mapping.items():
-            value = os.environ.get(env_var)
+        environ = os.environ
+        for env_var, section, key in _ENV_MAPPING:
+            value = environ.get(env_var)
             if value:
-                if key in ["port", "default_runs", "warmup_runs"]:
+                if key in _INT_KEYS:
                     value = int(value)
                 self.config[section][key] = value
 
@@ -80,7 +85,10 @@ class Config:
     def get(self, section: str, key: Optional[str] = None):
         """Get configuration value."""
         if key:
-            return self.config.get(section, {}).get(key)
+            try:
+                return self.config[section][key]
+            except KeyError:
+                return None
         return self.config.get(section)
 
     def set(self, section: str, key: str, value: Any):
@@ -1,6 +1,9 @@
 """Base classes for benchmarking."""
 
+import functools
 import logging
+import os
+import re
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -13,6 +16,41 @@ from .metrics import BenchmarkResult, MetricsCollector
 
 logger = logging.getLogger(__name__)
 
+# Longer strings are never treated as file paths (and avoid a stat() call)
+_MAX_SQL_PATH_LENGTH = 4096
+
+_READ_ONLY_SQL_RE = re.compile(r"\s*(SELECT|SHOW|EXPLAIN|VALUES)\b", re.IGNORECASE)
+# Row locks (FOR UPDATE/SHARE), SELECT INTO and EXPLAIN ANALYZE of a write
+_WRITE_OR_LOCK_SQL_RE = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|INTO|SHARE)\b", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_sql_file(path: str) -> str:
+    """Read a SQL file; repeated loads of the same path hit the cache."""
+    with open(path, "r") as f:
+        return f.read()
+
+
+def load_sql(sql: str) -> str:
+    """Return the contents of ``sql`` if it names a SQL file, else ``sql``."""
+    if len(sql) < _MAX_SQL_PATH_LENGTH and "\n" not in sql and os.path.isfile(sql):
+        return _read_sql_file(sql)
+    return sql
+
+
+def is_read_only_sql(sql: str) -> bool:
+    """
+    Return True if ``sql`` is a plain read (nothing to commit).
+
+    Locking reads and anything mentioning a write keyword count as writes.
+    A SELECT calling a function that writes still looks like a read.
+    """
+    if not _READ_ONLY_SQL_RE.match(sql):
+        return False
+    return not _WRITE_OR_LOCK_SQL_RE.search(sql)
+
 
 @dataclass
 class BenchmarkConfig:
@@ -27,6 +65,12 @@ class BenchmarkConfig:
     retry_on_error: int = 3
     batch_size: Optional[int] = None
     enable_profiling: bool = False
+    keep_executions: bool = True  # False keeps only streaming statistics
+    # Commit after each run (outside the timed region) instead of rolling back.
+    # Applies to every statement, so SELECTs calling writing functions commit too
+    commit_after_each: bool = False
+    use_prepared: bool = True  # PREPARE static SQL once per connection
+    fetch_mode: str = "all"  # all, count, none - how result rows are consumed
 
     def validate(self):
         """Validate configuration parameters."""
@@ -40,6 +84,8 @@ class BenchmarkConfig:
             raise ValueError("retry_on_error cannot be negative")
         if self.batch_size is not None and self.batch_size <= 0:
             raise ValueError("batch_size must be positive")
+        if self.fetch_mode not in ("all", "count", "none"):
+            raise ValueError("fetch_mode must be one of 'all', 'count', 'none'")
 
 
 class BaseBenchmark(ABC):
@@ -54,7 +100,7 @@ class BaseBenchmark(ABC):
         self.config = config or BenchmarkConfig()
         self.config.validate()
 
-        self.metrics_collector = MetricsCollector()
+        self.metrics_collector = self._new_collector()
         self._sql_query: Optional[str] = None
         self._sql_params: Optional[Dict[str, Any]] = None
         self._pre_hooks: List[Callable] = []
@@ -62,10 +108,10 @@ class BaseBenchmark(ABC):
         self._is_running = False
 
     def set_sql(self, sql: str, params: Optional[Dict[str, Any]] = None):
-        """Set the SQL query to benchmark."""
+        """Set the SQL query (or path to a SQL file) to benchmark."""
         if self._is_running:
             raise BenchmarkError("Cannot set SQL while benchmark is running")
-        self._sql_query = sql
+        self._sql_query = load_sql(sql)
         self._sql_params = params or {}
 
     def add_pre_hook(self, hook: Callable):
@@ -90,6 +136,13 @@ class BaseBenchmark(ABC):
         """Iterate over benchmark results as they complete."""
         pass
 
+    def _new_collector(self) -> MetricsCollector:
+        """Create a metrics collector honouring ``keep_executions``."""
+        # EXPLAIN plans only live on the executions, so they must be kept
+        return MetricsCollector(
+            keep_executions=self.config.keep_executions or self.config.collect_explain
+        )
+
     def _execute_hooks(self, hooks: List[Callable], context: Dict[str, Any]):
         """Execute a list of hooks with context."""
         for hook in hooks:
@@ -100,14 +153,14 @@ class BaseBenchmark(ABC):
 
     def reset(self):
         """Reset the benchmark state."""
-        self.metrics_collector = MetricsCollector()
+        self.metrics_collector = self._new_collector()
         self._is_running = False
 
     def get_status(self) -> Dict[str, Any]:
         """Get current benchmark status."""
         return {
             "is_running": self._is_running,
-            "runs_completed": len(self.metrics_collector.executions),
+            "runs_completed": self.metrics_collector.total_runs,
             "total_runs": self.config.number_of_runs,
             "sql_query": self._sql_query,
         }
@@ -2,6 +2,7 @@
 
 import logging
 import time
+import weakref
 from contextlib import contextmanager
 from typing import Any, Dict, Optional, Union
 
@@ -28,12 +29,21 @@ class ConnectionManager:
         self._pool = None
         self._single_conn = None
         self._pool_size = pool_size
+        # connection -> {statement name: SQL} prepared on that session
+        self._prepared: "weakref.WeakKeyDictionary[Any, Dict[str, str]]" = (
+            weakref.WeakKeyDictionary()
+        )
         self._max_overflow = max_overflow
 
+        # The connection source never changes, so pick checkout/checkin once
         if isinstance(connection_params, psycopg2.extensions.connection):
             self._single_conn = connection_params
+            self._checkout = self._checkout_single
+            self._checkin = self._checkin_single
         else:
             self._initialize_pool(pool_size, pool_size + max_overflow)
+            self._checkout = self._checkout_pooled
+            self._checkin = self._checkin_pooled
 
     def _normalize_params(self, params):
         """Normalize connection parameters."""
@@ -44,6 +54,7 @@ class ConnectionManager:
                 "password": "",
                 "host": "localhost",
                 "port": "5432",
+                "connect_timeout": 10,
             }
         elif isinstance(params, dict):
             # Ensure all required parameters are present
@@ -53,6 +64,7 @@ class ConnectionManager:
                 "password": "",
                 "host": "localhost",
                 "port": "5432",
+                "connect_timeout": 10,
             }
             return {**defaults, **params}
         elif isinstance(params, psycopg2.extensions.connection):
@@ -73,31 +85,53 @@ class ConnectionManager:
             except psycopg2.Error as e:
                 raise BenchmarkConnectionError(f"Failed to create connection pool: {e}")
 
+    def _checkout_single(self):
+        """Return the single connection if it is still open."""
+        if self._single_conn.closed:
+            raise BenchmarkConnectionError("Connection is closed")
+        return self._single_conn
+
+    def _checkin_single(self, conn):
+        """The single connection stays open between uses."""
+
+    def _checkout_pooled(self):
+        """Take a connection from the pool."""
+        if not self._pool:
+            raise BenchmarkConnectionError("No connection available")
+        return self._pool.getconn()
+
+    def _checkin_pooled(self, conn):
+        """Return a connection to the pool, dropping it if it has died."""
+        self._pool.putconn(conn, close=bool(conn.closed))
+
+    def _validate(self, conn):
+        """Round-trip a trivial query; a dead pooled connection is discarded."""
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception:
+            if self._pool:
+                self._pool.putconn(conn, close=True)
+            raise
+
     @contextmanager
-    def get_connection(self, retry_attempts: int = 3, retry_delay: float = 1.0):
-        """Get a connection from the pool or return single connection."""
+    def get_connection(
+        self, retry_attempts: int = 3, retry_delay: float = 1.0, validate: bool = False
+    ):
+        """Get a connection from the pool or return single connection.
+
+        Checkouts are not probed by default, since a ``SELECT 1`` per checkout
+        would double the round-trips of a benchmark loop; pass
+        ``validate=True`` to test the connection before it is handed out.
+        """
         last_error = None
 
         for attempt in range(retry_attempts):
             try:
-                if self._single_conn:
-                    # Check if connection is still valid
-                    if self._single_conn.closed:
-                        raise BenchmarkConnectionError("Connection is closed")
-                    yield self._single_conn
-                    return
-                elif self._pool:
-                    conn = self._pool.getconn()
-                    try:
-                        # Test connection
-                        with conn.cursor() as cursor:
-                            cursor.execute("SELECT 1")
-                        yield conn
-                        return
-                    finally:
-                        self._pool.putconn(conn)
-                else:
-                    raise BenchmarkConnectionError("No connection available")
+                conn = self._checkout()
+                if validate:
+                    self._validate(conn)
+                break
             except Exception as e:
                 last_error = e
                 if attempt < retry_attempts - 1:
@@ -105,13 +139,28 @@ class ConnectionManager:
                         f"Connection attempt {attempt + 1} failed: {e}. Retrying..."
                     )
                     time.sleep(retry_delay)
+        else:
+            raise BenchmarkConnectionError(
+                f"All connection attempts failed: {last_error}"
+            )
 
-        raise BenchmarkConnectionError(f"All connection attempts failed: {last_error}")
+        try:
+            yield conn
+        finally:
+            self._checkin(conn)
 
     def execute_query(
         self, query: str, params: Optional[tuple] = None, fetch: bool = True
     ):
         """Execute a query and optionally fetch results."""
+        try:
+            return self._execute_query(query, params, fetch)
+        except psycopg2.OperationalError as e:
+            # The dead connection was dropped on checkin; try a fresh one once
+            logger.warning(f"Query failed on a broken connection: {e}. Retrying...")
+            return self._execute_query(query, params, fetch)
+
+    def _execute_query(self, query: str, params: Optional[tuple], fetch: bool):
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(query, params)
@@ -119,6 +168,67 @@ class ConnectionManager:
                     return cursor.fetchall()
                 return None
 
+    def prepare_statement(self, conn, cursor, name: str, sql: str):
+        """Make ``name`` refer to ``sql`` on ``conn``, preparing it only if needed.
+
+        Every connection's prepared statements are tracked here, so callers
+        that share a pooled session never re-prepare or clobber each other.
+        A statement already prepared under ``name`` with different SQL is
+        deallocated first.
+        """
+        prepared = self._prepared.setdefault(conn, {})
+        if prepared.get(name) != sql:
+            if name in prepared:
+                cursor.execute(f"DEALLOCATE {name}")
+                del prepared[name]
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            prepared[name] = sql
+
+    def execute_prepared(
+        self,
+        name: str,
+        sql: str,
+        params: Optional[tuple] = None,
+        fetch: bool = True,
+    ):
+        """Execute ``sql`` as a server-side prepared statement called ``name``.
+
+        The statement is prepared the first time each connection runs it, so
+        repeated calls skip parsing and planning. ``sql`` uses PostgreSQL's
+        ``$1, $2, ...`` placeholders; ``params`` supplies them in order.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                self.prepare_statement(conn, cursor, name, sql)
+                if params:
+                    placeholders = ", ".join(["%s"] * len(params))
+                    cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+                else:
+                    cursor.execute(f"EXECUTE {name}")
+                if fetch and cursor.description:
+                    return cursor.fetchall()
+                return None
+
+    def pipeline_execute(
+        self, query: str, params: Optional[tuple] = None, count: int = 1
+    ):
+        """Send ``count`` copies of a query to the server in one round trip.
+
+        psycopg2 has no pipeline mode, but the simple query protocol accepts
+        several ``;``-separated statements in a single message, so the
+        network cost is paid once per batch instead of once per query.
+        Returns the rows of the last statement, if it produced any.
+        """
+        if count < 1:
+            raise ValueError("count must be positive")
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                statement = cursor.mogrify(query, params).rstrip(b"; \t\r\n")
+                cursor.execute(b";".join([statement] * count))
+                if cursor.description:
+                    return cursor.fetchall()
+                return None
+
     def test_connection(self) -> bool:
         """Test if connection is working."""
         try:
@@ -140,14 +250,13 @@ class ConnectionManager:
                 info["isolation_level"] = conn.isolation_level
 
                 with conn.cursor() as cursor:
-                    cursor.execute("SELECT version()")
-                    info["server_version"] = cursor.fetchone()[0]
-
-                    cursor.execute("SELECT current_database()")
-                    info["database"] = cursor.fetchone()[0]
-
-                    cursor.execute("SELECT current_user")
-                    info["user"] = cursor.fetchone()[0]
+                    # One round trip for all three
+                    cursor.execute("SELECT version(), current_database(), current_user")
+                    (
+                        info["server_version"],
+                        info["database"],
+                        info["user"],
+                    ) = cursor.fetchone()
 
         except Exception as e:
             info["error"] = str(e)
@@ -1,43 +1,288 @@
 """Metrics collection and calculation."""
 
+import array
+import bisect
+import functools
 import json
-import statistics
+import math
+import random
+import struct
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+PERCENTILES = (25, 50, 75, 90, 95, 99, 99.9)
+
+LATENCY_BUCKETS = (
+    "<1ms",
+    "1-5ms",
+    "5-10ms",
+    "10-50ms",
+    "50-100ms",
+    "100-500ms",
+    "500ms-1s",
+    "1s-5s",
+    ">5s",
+)
+# Upper bounds (ms) of every bucket but the last; a duration equal to a
+# bound belongs to the bucket above it
+_LATENCY_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+_LATENCY_BOUNDS_ARRAY = np.array(_LATENCY_BOUNDS_MS, dtype=np.float64)
+
+
+def _latency_bucket(d: float) -> str:
+    """Name of the latency bucket a duration in milliseconds falls into."""
+    return LATENCY_BUCKETS[bisect.bisect_right(_LATENCY_BOUNDS_MS, d)]
+
+
+# Above this many samples one fused pass beats four separate numpy passes
+_FUSED_STATS_MIN_SIZE = 100_000
+
+
+@functools.lru_cache(maxsize=None)
+def _fused_stats_kernel():
+    """
+    Compile the one-pass min/max/mean/stddev/histogram kernel.
+
+    numba is imported here rather than at module level so that importing
+    the package stays cheap; returns None when numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - numba is an optional speedup
+        return None
+
+    # Serial on purpose: numba's parallel threading layers do not survive
+    # the fork()-based worker processes used elsewhere in the package
+    @njit(fastmath=True, cache=True)
+    def fused_stats(durations, bounds):
+        n = durations.size
+        shift = durations[0]  # keeps the sum of squares well conditioned
+        lowest = np.inf
+        highest = -np.inf
+        total = 0.0
+        squares = 0.0
+        counts = np.zeros(bounds.size + 1, dtype=np.int64)
+        for i in range(n):
+            x = durations[i]
+            lowest = min(lowest, x)
+            highest = max(highest, x)
+            d = x - shift
+            total += d
+            squares += d * d
+            counts[np.searchsorted(bounds, x, side="right")] += 1
+        variance = (squares - total * total / n) / (n - 1)
+        return lowest, highest, shift + total / n, np.sqrt(max(variance, 0.0)), counts
+
+    return fused_stats
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P-square algorithm.
+
+    Keeps five markers instead of the full sample (Jain & Chlamtac, 1985).
+    """
+
+    def __init__(self, percentile: float):
+        self.p = percentile / 100
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments: List[float] = []
+
+    def add(self, x: float):
+        """Add an observation."""
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                p = self.p
+                self._heights = sorted(self._initial)
+                self._positions = [0, 1, 2, 3, 4]
+                self._desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+                self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+            return
 
+        q = self._heights
+        n = self._positions
 
-@dataclass
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                # Piecewise-parabolic prediction, linear if it leaves the bracket
+                qp = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    def value(self) -> float:
+        """Current quantile estimate."""
+        if len(self._initial) < 5:
+            if not self._initial:
+                return 0
+            ordered = sorted(self._initial)
+            idx = min(int(len(ordered) * self.p), len(ordered) - 1)
+            return ordered[idx]
+        return self._heights[2]
+
+
+class RunningStats:
+    """Welford mean/variance plus min/max, updated in O(1) per observation."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, duration_ms: float):
+        """Add a successful execution duration."""
+        self.count += 1
+        delta = duration_ms - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (duration_ms - self.mean)
+        if duration_ms < self.min:
+            self.min = duration_ms
+        if duration_ms > self.max:
+            self.max = duration_ms
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0
+
+
+class StreamingStats(RunningStats):
+    """
+    Constant-memory summary of successful execution durations.
+
+    Adds P-square percentile estimates, the latency histogram and a
+    fixed-size reservoir sample to the running moments, which the
+    statistical analyzer can work from when executions are not retained.
+    """
+
+    def __init__(self, reservoir_size: int = 5000, seed: Optional[int] = None):
+        super().__init__()
+        self.quantiles = {f"p{p}": P2Quantile(p) for p in PERCENTILES}
+        self.latency_distribution = dict.fromkeys(LATENCY_BUCKETS, 0)
+        self.reservoir_size = reservoir_size
+        self.samples: List[float] = []
+        self._random = random.Random(seed)
+
+    def add(self, duration_ms: float):
+        """Add a successful execution duration."""
+        super().add(duration_ms)
+
+        for estimator in self.quantiles.values():
+            estimator.add(duration_ms)
+        self.latency_distribution[_latency_bucket(duration_ms)] += 1
+
+        # Reservoir sampling (Algorithm R)
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(duration_ms)
+        else:
+            j = self._random.randrange(self.count)
+            if j < self.reservoir_size:
+                self.samples[j] = duration_ms
+
+    def percentiles(self) -> Dict[str, float]:
+        """Current percentile estimates."""
+        return {name: est.value() for name, est in self.quantiles.items()}
+
+
+@dataclass(slots=True)
 class QueryExecution:
     """Single query execution metrics."""
 
     run_id: int
     start_time: datetime
     end_time: datetime
-    duration: timedelta
+    duration_ns: int
     success: bool
     error: Optional[str] = None
     explain_plan: Optional[Dict[str, Any]] = None
     buffer_stats: Optional[Dict[str, Any]] = None
     io_stats: Optional[Dict[str, Any]] = None
 
+    @property
+    def duration(self) -> timedelta:
+        """Duration as a timedelta."""
+        return timedelta(microseconds=self.duration_ns / 1000)
+
     @property
     def duration_ms(self) -> float:
         """Duration in milliseconds."""
-        return self.duration.total_seconds() * 1000
+        return self.duration_ns / 1_000_000
 
     @property
     def duration_us(self) -> float:
         """Duration in microseconds."""
-        return self.duration.total_seconds() * 1000000
+        return self.duration_ns / 1000
+
+    def __reduce__(self):
+        # Pickle as positional constructor args rather than a field-name dict;
+        # executions are pickled once each when streamed between processes
+        return (
+            self.__class__,
+            (
+                self.run_id,
+                self.start_time,
+                self.end_time,
+                self.duration_ns,
+                self.success,
+                self.error,
+                self.explain_plan,
+                self.buffer_stats,
+                self.io_stats,
+            ),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        record = self._record()
+        record["start_time"] = self.start_time.isoformat()
+        record["end_time"] = self.end_time.isoformat()
+        return record
+
+    def _record(self) -> Dict[str, Any]:
+        """The ``to_dict()`` fields, with timestamps left as datetimes."""
         return {
             "run_id": self.run_id,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "duration_ms": self.duration_ms,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": self.duration_ns / 1_000_000,
             "success": self.success,
             "error": self.error,
             "explain_plan": self.explain_plan,
@@ -56,126 +301,136 @@ class BenchmarkResult:
     failed_runs: int
     start_time: datetime
     end_time: datetime
-
-    # Statistics
-    min_time_ms: float = field(init=False)
-    max_time_ms: float = field(init=False)
-    avg_time_ms: float = field(init=False)
-    median_time_ms: float = field(init=False)
-    stddev_time_ms: float = field(init=False)
-    percentiles: Dict[str, float] = field(init=False)
-
-    # Advanced metrics
-    throughput_qps: float = field(init=False)  # Queries per second
-    latency_distribution: Dict[str, int] = field(init=False)
-    cv: float = field(init=False)  # Coefficient of variation
-
-    def __post_init__(self):
-        """Calculate statistics after initialization."""
-        self._calculate_statistics()
-
-    def _calculate_statistics(self):
-        """Calculate all statistics from executions."""
-        if not self.executions:
-            self._set_empty_stats()
-            return
-
-        successful_durations = [e.duration_ms for e in self.executions if e.success]
-
-        if not successful_durations:
-            self._set_empty_stats()
-            return
-
-        self.min_time_ms = min(successful_durations)
-        self.max_time_ms = max(successful_durations)
-        self.avg_time_ms = statistics.mean(successful_durations)
-        self.median_time_ms = statistics.median(successful_durations)
-
-        if len(successful_durations) > 1:
-            self.stddev_time_ms = statistics.stdev(successful_durations)
-            self.cv = (
-                (self.stddev_time_ms / self.avg_time_ms) if self.avg_time_ms > 0 else 0
-            )
-        else:
-            self.stddev_time_ms = 0
-            self.cv = 0
-
-        # Calculate percentiles
-        self.percentiles = self._calculate_percentiles(successful_durations)
-
-        # Calculate throughput
+    streaming_stats: Optional[StreamingStats] = field(default=None, repr=False)
+    # Columnar copies of executions' duration_ns / success, when available
+    durations_ns: Optional[array.array] = field(default=None, repr=False)
+    success_mask: Optional[bytearray] = field(default=None, repr=False)
+
+    # Statistics are computed on first access, so callers only pay for
+    # the ones they read (e.g. get_summary() never sorts for percentiles)
+
+    @cached_property
+    def _stream(self) -> Optional[StreamingStats]:
+        """Streaming accumulators to read from when executions were not kept."""
+        if not self.executions and self.streaming_stats and self.streaming_stats.count:
+            return self.streaming_stats
+        return None
+
+    @cached_property
+    def _durations(self) -> np.ndarray:
+        if self._stream is not None:
+            return np.empty(0)
+        return self.successful_durations()
+
+    @cached_property
+    def _fused(self) -> Optional[tuple]:
+        """(min, max, mean, stddev, bucket counts) in one pass, for big samples."""
+        if len(self._durations) < _FUSED_STATS_MIN_SIZE:
+            return None
+        kernel = _fused_stats_kernel()
+        if kernel is None:
+            return None
+        return kernel(self._durations, _LATENCY_BOUNDS_ARRAY)
+
+    @cached_property
+    def min_time_ms(self) -> float:
+        if self._stream is not None:
+            return self._stream.min
+        if self._fused is not None:
+            return float(self._fused[0])
+        return float(self._durations.min()) if len(self._durations) else 0
+
+    @cached_property
+    def max_time_ms(self) -> float:
+        if self._stream is not None:
+            return self._stream.max
+        if self._fused is not None:
+            return float(self._fused[1])
+        return float(self._durations.max()) if len(self._durations) else 0
+
+    @cached_property
+    def avg_time_ms(self) -> float:
+        if self._stream is not None:
+            return self._stream.mean
+        if self._fused is not None:
+            return float(self._fused[2])
+        return float(self._durations.mean()) if len(self._durations) else 0
+
+    @cached_property
+    def median_time_ms(self) -> float:
+        if self._stream is not None:
+            return self.percentiles["p50"]
+        return float(np.median(self._durations)) if len(self._durations) else 0
+
+    @cached_property
+    def stddev_time_ms(self) -> float:
+        if self._stream is not None:
+            return self._stream.stddev
+        if self._fused is not None:
+            return float(self._fused[3])
+        if len(self._durations) > 1:
+            return float(self._durations.std(ddof=1))
+        return 0
+
+    @cached_property
+    def percentiles(self) -> Dict[str, float]:
+        if self._stream is not None:
+            return self._stream.percentiles()
+        return self._calculate_percentiles(self._durations)
+
+    @cached_property
+    def throughput_qps(self) -> float:
+        """Queries per second."""
         total_time_seconds = (self.end_time - self.start_time).total_seconds()
-        self.throughput_qps = (
+        if not len(self._durations) and self._stream is None:
+            return 0
+        return (
             self.successful_runs / total_time_seconds if total_time_seconds > 0 else 0
         )
 
-        # Calculate latency distribution
-        self.latency_distribution = self._calculate_latency_distribution(
-            successful_durations
-        )
-
-    def _set_empty_stats(self):
-        """Set empty statistics when no data available."""
-        self.min_time_ms = 0
-        self.max_time_ms = 0
-        self.avg_time_ms = 0
-        self.median_time_ms = 0
-        self.stddev_time_ms = 0
-        self.cv = 0
-        self.percentiles = {}
-        self.throughput_qps = 0
-        self.latency_distribution = {}
-
-    def _calculate_percentiles(self, durations: List[float]) -> Dict[str, float]:
+    @cached_property
+    def latency_distribution(self) -> Dict[str, int]:
+        if self._stream is not None:
+            return dict(self._stream.latency_distribution)
+        if not len(self._durations):
+            return {}
+        if self._fused is not None:
+            return dict(zip(LATENCY_BUCKETS, self._fused[4].tolist()))
+        return self._calculate_latency_distribution(self._durations)
+
+    @cached_property
+    def cv(self) -> float:
+        """Coefficient of variation."""
+        return (self.stddev_time_ms / self.avg_time_ms) if self.avg_time_ms > 0 else 0
+
+    def successful_durations(self) -> np.ndarray:
+        """Durations in milliseconds of the successful executions."""
+        if self.durations_ns is not None:
+            durations_ns = np.frombuffer(self.durations_ns, dtype=np.int64)
+            mask = np.frombuffer(self.success_mask, dtype=np.bool_)
+            return durations_ns[mask] / 1_000_000
+        durations_ns = (e.duration_ns for e in self.executions if e.success)
+        return np.fromiter(durations_ns, dtype=np.float64) / 1_000_000
+
+    def _calculate_percentiles(self, durations: np.ndarray) -> Dict[str, float]:
         """Calculate percentiles from durations."""
-        if not durations:
+        if not len(durations):
             return {}
 
-        sorted_durations = sorted(durations)
-        percentiles = {}
-
-        for p in [25, 50, 75, 90, 95, 99, 99.9]:
-            idx = int(len(sorted_durations) * p / 100)
-            idx = min(idx, len(sorted_durations) - 1)
-            percentiles[f"p{p}"] = sorted_durations[idx]
+        n = len(durations)
+        indices = np.minimum((n * np.array(PERCENTILES) / 100).astype(np.intp), n - 1)
+        # Quickselect just the ranks needed instead of sorting everything
+        values = np.partition(durations, np.unique(indices))[indices]
 
-        return percentiles
+        return {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
 
-    def _calculate_latency_distribution(self, durations: List[float]) -> Dict[str, int]:
+    def _calculate_latency_distribution(self, durations: np.ndarray) -> Dict[str, int]:
         """Calculate latency distribution buckets."""
-        buckets = {
-            "<1ms": 0,
-            "1-5ms": 0,
-            "5-10ms": 0,
-            "10-50ms": 0,
-            "50-100ms": 0,
-            "100-500ms": 0,
-            "500ms-1s": 0,
-            "1s-5s": 0,
-            ">5s": 0,
-        }
-
-        for d in durations:
-            if d < 1:
-                buckets["<1ms"] += 1
-            elif d < 5:
-                buckets["1-5ms"] += 1
-            elif d < 10:
-                buckets["5-10ms"] += 1
-            elif d < 50:
-                buckets["10-50ms"] += 1
-            elif d < 100:
-                buckets["50-100ms"] += 1
-            elif d < 500:
-                buckets["100-500ms"] += 1
-            elif d < 1000:
-                buckets["500ms-1s"] += 1
-            elif d < 5000:
-                buckets["1s-5s"] += 1
-            else:
-                buckets[">5s"] += 1
-
-        return buckets
+        counts = np.bincount(
+            np.searchsorted(_LATENCY_BOUNDS_ARRAY, durations, side="right"),
+            minlength=len(LATENCY_BUCKETS),
+        )
+        return dict(zip(LATENCY_BUCKETS, counts.tolist()))
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the benchmark results."""
@@ -217,81 +472,204 @@ class BenchmarkResult:
             },
         }
 
+        if orjson is not None:
+            if include_executions:
+                # orjson calls back for each execution and formats the
+                # datetimes itself, so no intermediate isoformat strings
+                data["executions"] = self.executions
+            return orjson.dumps(
+                data,
+                default=QueryExecution._record,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode()
+
         if include_executions:
             data["executions"] = [e.to_dict() for e in self.executions]
-
         return json.dumps(data, indent=2)
 
 
+_BUFFER_HEADER = struct.Struct("<Q")  # number of executions
+
+
+def pack_executions(executions: Iterable[QueryExecution]) -> bytes:
+    """
+    Pack the durations and success flags of ``executions`` into bytes.
+
+    Nine bytes per execution instead of a pickled dataclass, for shipping
+    results between processes when the executions themselves are not kept.
+    """
+    durations_ns = array.array("q")
+    success = bytearray()
+    for execution in executions:
+        durations_ns.append(execution.duration_ns)
+        success.append(execution.success)
+    return _BUFFER_HEADER.pack(len(success)) + durations_ns.tobytes() + bytes(success)
+
+
 class MetricsCollector:
     """Collects and aggregates benchmark metrics."""
 
-    def __init__(self):
+    def __init__(self, keep_executions: bool = True):
+        self.keep_executions = keep_executions
         self.executions: List[QueryExecution] = []
+        self._stream: Optional[StreamingStats] = (
+            None if keep_executions else StreamingStats()
+        )
+        # Live counters for get_current_stats(), whichever mode is in use
+        self._running = self._stream or RunningStats()
+        self._total_runs = 0
+        self._successful_runs = 0
+        # Structure-of-arrays view of the kept executions for fast analysis
+        self._durations_ns = array.array("q")
+        self._success = bytearray()
         self._start_time: Optional[datetime] = None
+        self._start_perf_ns: int = 0
         self._end_time: Optional[datetime] = None
         self._is_collecting = False
 
     def start(self):
         """Mark the start of benchmarking."""
         self._start_time = datetime.now()
+        self._start_perf_ns = time.perf_counter_ns()
         self._is_collecting = True
 
+    def wall_time(self, perf_ns: int) -> datetime:
+        """Convert a ``time.perf_counter_ns()`` reading into wall-clock time.
+
+        The wall clock is sampled once in ``start()``; every later timestamp is
+        derived from the monotonic counter so the hot loop never calls
+        ``datetime.now()``.
+        """
+        if self._start_time is None:
+            raise RuntimeError("Metrics collector is not started")
+        return self._start_time + timedelta(
+            microseconds=(perf_ns - self._start_perf_ns) // 1000
+        )
+
     def end(self):
         """Mark the end of benchmarking."""
         self._end_time = datetime.now()
         self._is_collecting = False
 
+    @property
+    def total_runs(self) -> int:
+        """Number of executions added so far."""
+        return self._total_runs
+
     def add_execution(self, execution: QueryExecution):
         """Add a query execution result."""
         if not self._is_collecting:
             raise RuntimeError("Metrics collector is not started")
-        self.executions.append(execution)
+        if self.keep_executions:
+            self.executions.append(execution)
+            self._durations_ns.append(execution.duration_ns)
+            self._success.append(execution.success)
+
+        self._total_runs += 1
+        if execution.success:
+            self._successful_runs += 1
+            self._running.add(execution.duration_ms)
+
+    def add_executions(self, executions: Iterable[QueryExecution]):
+        """Add many query execution results at once."""
+        if not self._is_collecting:
+            raise RuntimeError("Metrics collector is not started")
+        if self.keep_executions:
+            start = len(self.executions)
+            self.executions.extend(executions)
+            added = self.executions[start:]
+            self._durations_ns.extend([e.duration_ns for e in added])
+            self._success.extend([e.success for e in added])
+            self._total_runs += len(added)
+            for execution in added:
+                if execution.success:
+                    self._successful_runs += 1
+                    self._running.add(execution.duration_ms)
+            return
+
+        for execution in executions:
+            self.add_execution(execution)
+
+    def add_buffer(self, buffer: bytes):
+        """Add the durations and success flags packed by ``pack_executions``.
+
+        Buffers carry no per-execution detail, so only a collector that does
+        not keep executions can take them.
+        """
+        if not self._is_collecting:
+            raise RuntimeError("Metrics collector is not started")
+        if self.keep_executions:
+            raise ValueError("Packed buffers need keep_executions=False")
+
+        (count,) = _BUFFER_HEADER.unpack_from(buffer)
+        offset = _BUFFER_HEADER.size
+        durations_ns = np.frombuffer(buffer, dtype=np.int64, count=count, offset=offset)
+        success = np.frombuffer(
+            buffer, dtype=np.bool_, count=count, offset=offset + 8 * count
+        )
+
+        self._total_runs += count
+        successful = (durations_ns[success] / 1_000_000).tolist()
+        self._successful_runs += len(successful)
+        for duration_ms in successful:
+            self._running.add(duration_ms)
 
     def get_result(self) -> BenchmarkResult:
         """Get the complete benchmark result."""
         if not self._start_time or not self._end_time:
             raise RuntimeError("Benchmark not properly started/ended")
 
-        successful = [e for e in self.executions if e.success]
-        failed = [e for e in self.executions if not e.success]
+        if not self.keep_executions:
+            return BenchmarkResult(
+                executions=[],
+                total_runs=self._total_runs,
+                successful_runs=self._successful_runs,
+                failed_runs=self._total_runs - self._successful_runs,
+                start_time=self._start_time,
+                end_time=self._end_time,
+                streaming_stats=self._stream,
+            )
 
         return BenchmarkResult(
             executions=self.executions,
-            total_runs=len(self.executions),
-            successful_runs=len(successful),
-            failed_runs=len(failed),
+            total_runs=self._total_runs,
+            successful_runs=self._successful_runs,
+            failed_runs=self._total_runs - self._successful_runs,
             start_time=self._start_time,
             end_time=self._end_time,
+            durations_ns=self._durations_ns,
+            success_mask=self._success,
         )
 
     def get_current_stats(self) -> Dict[str, Any]:
         """Get current statistics while collecting."""
-        successful = [e for e in self.executions if e.success]
-        failed = [e for e in self.executions if not e.success]
-
         stats = {
-            "total_runs": len(self.executions),
-            "successful_runs": len(successful),
-            "failed_runs": len(failed),
+            "total_runs": self._total_runs,
+            "successful_runs": self._successful_runs,
+            "failed_runs": self._total_runs - self._successful_runs,
             "is_collecting": self._is_collecting,
         }
-
-        if successful:
-            durations = [e.duration_ms for e in successful]
+        if self._running.count:
             stats.update(
                 {
-                    "current_avg_ms": statistics.mean(durations),
-                    "current_min_ms": min(durations),
-                    "current_max_ms": max(durations),
+                    "current_avg_ms": self._running.mean,
+                    "current_min_ms": self._running.min,
+                    "current_max_ms": self._running.max,
+                    "current_stddev_ms": self._running.stddev,
                 }
             )
-
         return stats
 
     def reset(self):
         """Reset the collector."""
         self.executions = []
+        self._stream = None if self.keep_executions else StreamingStats()
+        self._running = self._stream or RunningStats()
+        self._total_runs = 0
+        self._successful_runs = 0
+        self._durations_ns = array.array("q")
+        self._success = bytearray()
         self._start_time = None
+        self._start_perf_ns = 0
         self._end_time = None
         self._is_collecting = False
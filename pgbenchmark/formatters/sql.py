@@ -1,17 +1,50 @@
 """SQL query formatting and templating."""
 
+import bisect
+import functools
 import hashlib
+import itertools
 import logging
 import random
 import re
 import string
+import time
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
+import numpy as np
 from jinja2 import Environment, Template, TemplateSyntaxError, meta
 
 logger = logging.getLogger(__name__)
 
+# Any of these means the SQL needs Jinja; without them it renders to itself
+_JINJA_DELIMITERS = re.compile(r"\{\{|\{%|\{#")
+_NON_WORD = re.compile(r"[^\w]")
+# A bare "{{ name }}" placeholder, which can be substituted without Jinja
+_SIMPLE_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+# Names Jinja treats as literals rather than variables
+_JINJA_CONSTANTS = frozenset(["true", "false", "none", "True", "False", "None"])
+# Rendered SQL longer than this is collapsed without going through the cache
+_COLLAPSE_CACHE_MAX_LEN = 4096
+
+
+@functools.lru_cache(maxsize=1024)
+def _collapse_whitespace(sql: str) -> str:
+    """Collapse whitespace runs to single spaces, memoised per rendered string."""
+    # str.split() strips the ends and splits on exactly the characters the
+    # old r"\s+" regex matched, in a single C-level pass
+    return " ".join(sql.split())
+
+
+# Exact-type fast path for _sql_escape; subclasses take the isinstance chain
+_SQL_ESCAPERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "NULL",
+    bool: lambda value: "TRUE" if value else "FALSE",
+    int: str,
+    float: str,
+    datetime: lambda value: f"'{value.isoformat()}'",
+}
+
 
 class SQLFormatter:
     """SQL query formatting and templating with Jinja2."""
@@ -23,8 +56,25 @@ class SQLFormatter:
             lstrip_blocks=True,
         )
         self.generators: Dict[str, Callable] = {}
+        # Snapshot of generators.items(), rebuilt whenever generators change
+        self._generator_items: Tuple[Tuple[str, Callable], ...] = ()
         self.static_params: Dict[str, Any] = {}
+        # Raw SQL -> compiled template, so each distinct query is parsed once
+        self._template_cache: Dict[str, Template] = {}
+        # Raw SQL -> whitespace-collapsed SQL for queries with no Jinja syntax
+        self._plain_cache: Dict[str, str] = {}
+        # Raw SQL -> (literal, name, literal, ...) for templates made only of
+        # bare placeholders, or () when the template needs full Jinja
+        self._segment_cache: Dict[str, Tuple[str, ...]] = {}
+        # Raw SQL -> str.format_map equivalent of its segments
+        self._format_strings: Dict[str, str] = {}
+        # Bounded per instance: validate_sql/get_template_variables may see
+        # many ad-hoc templates over the life of a long-running process
+        self._undeclared_variables = functools.lru_cache(maxsize=256)(
+            self._find_undeclared_variables
+        )
         self._setup_default_filters()
+        self._setup_default_globals()
 
     def _setup_default_filters(self):
         """Setup default Jinja2 filters for SQL formatting."""
@@ -34,9 +84,23 @@ class SQLFormatter:
         self.env.filters["sql_list"] = self._sql_list
         self.env.filters["sql_like"] = self._sql_like_pattern
 
+    def _setup_default_globals(self):
+        """Expose utility functions to every template."""
+        self.env.globals.update(
+            {
+                "now": datetime.now,
+                "random": random,
+                "range": range,
+                "len": len,
+            }
+        )
+
     @staticmethod
     def _sql_escape(value: Any) -> str:
         """Escape a value for SQL."""
+        escape = _SQL_ESCAPERS.get(type(value))
+        if escape is not None:
+            return escape(value)
         if value is None:
             return "NULL"
         elif isinstance(value, bool):
@@ -52,7 +116,7 @@ class SQLFormatter:
     def _sql_identifier(name: str) -> str:
         """Format a SQL identifier (table/column name)."""
         # Remove any non-alphanumeric characters except underscore
-        clean_name = re.sub(r"[^\w]", "", name)
+        clean_name = _NON_WORD.sub("", name)
         # Quote the identifier
         return f'"{clean_name}"'
 
@@ -61,7 +125,8 @@ class SQLFormatter:
         """Format a list of values for SQL IN clause."""
         if not values:
             return "(NULL)"
-        escaped_values = [SQLFormatter._sql_escape(v) for v in values]
+        escape = SQLFormatter._sql_escape
+        escaped_values = [escape(v) for v in values]
         return f"({', '.join(escaped_values)})"
 
     @staticmethod
@@ -69,7 +134,9 @@ class SQLFormatter:
         value: str, prefix: bool = False, suffix: bool = False
     ) -> str:
         """Format a LIKE pattern."""
-        escaped = value.replace("%", "\\%").replace("_", "\\_")
+        escaped = value
+        if "%" in value or "_" in value:
+            escaped = value.replace("%", "\\%").replace("_", "\\_")
         if prefix and suffix:
             return f"'%{escaped}%'"
         elif prefix:
@@ -90,11 +157,14 @@ class SQLFormatter:
         if not callable(generator):
             raise ValueError(f"Generator for '{placeholder}' must be callable")
         self.generators[placeholder] = generator
+        self._generator_items = tuple(self.generators.items())
         logger.debug(f"Added generator for placeholder: {placeholder}")
 
     def add_static_param(self, name: str, value: Any):
         """Add a static parameter value."""
         self.static_params[name] = value
+        # Templates read globals lazily, so format() needn't merge these in
+        self.env.globals[name] = value
 
     def format(self, sql: str, params: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -107,38 +177,62 @@ class SQLFormatter:
         Returns:
             Formatted SQL query
         """
+        generator_items = self._generator_items
+        static_params = self.static_params
+
+        # Plain SQL renders to itself, so skip Jinja entirely. Generators
+        # still force a render since callers may rely on them being called.
+        if not generator_items:
+            plain = self._plain_cache.get(sql)
+            if plain is not None:
+                return plain
+            if not _JINJA_DELIMITERS.search(sql):
+                plain = self._plain_cache[sql] = " ".join(sql.split())
+                return plain
+
         params = params or {}
 
         # Generate values for registered generators
         generated_values = {}
-        for placeholder, generator in self.generators.items():
-            if placeholder not in params:  # Don't override provided params
-                try:
-                    generated_values[placeholder] = generator()
-                except Exception as e:
-                    logger.error(f"Generator for '{placeholder}' failed: {e}")
-                    generated_values[placeholder] = None
-
-        # Combine all parameters (priority: params > generated > static)
-        all_params = {**self.static_params, **generated_values, **params}
-
-        # Add utility functions to template context
-        all_params.update(
-            {
-                "now": datetime.now,
-                "random": random,
-                "range": range,
-                "len": len,
-            }
-        )
+        for placeholder, generator in generator_items:
+            if params and placeholder in params:  # Don't override provided params
+                continue
+            try:
+                generated_values[placeholder] = generator()
+            except Exception as e:
+                logger.error(f"Generator for '{placeholder}' failed: {e}")
+                generated_values[placeholder] = None
+
+        # Combine parameters (priority: params > generated); static params
+        # are environment globals, which any template variable overrides
+        if generated_values:
+            all_params = generated_values
+            all_params.update(params)
+        else:
+            all_params = params
 
         try:
-            # Use Jinja2 for templating
-            template = self.env.from_string(sql)
-            formatted = template.render(**all_params)
-
-            # Clean up any extra whitespace
-            formatted = re.sub(r"\s+", " ", formatted).strip()
+            segments = self._segments(sql)
+            if segments:
+                if static_params:
+                    all_params = {**static_params, **all_params}
+                try:
+                    # format_map runs the substitution loop in C
+                    formatted = self._format_strings[sql].format_map(all_params)
+                except KeyError:
+                    # Some name is a global or undefined; resolve it like Jinja
+                    formatted = self._substitute(segments, all_params)
+            else:
+                # Use Jinja2 for templating
+                template = self._compile(sql)
+                formatted = template.render(all_params)
+
+            # Clean up any extra whitespace. Workers often render the same
+            # few parameter combinations, so short results are memoised
+            if len(formatted) <= _COLLAPSE_CACHE_MAX_LEN:
+                formatted = _collapse_whitespace(formatted)
+            else:
+                formatted = " ".join(formatted.split())
 
             return formatted
         except TemplateSyntaxError as e:
@@ -148,6 +242,51 @@ class SQLFormatter:
             logger.error(f"SQL formatting failed: {e}")
             raise
 
+    def _compile(self, sql: str) -> Template:
+        """Return the compiled template for ``sql``, compiling it on first use."""
+        template = self._template_cache.get(sql)
+        if template is None:
+            template = self.env.from_string(sql)
+            self._template_cache[sql] = template
+        return template
+
+    def _segments(self, sql: str) -> Tuple[str, ...]:
+        """Split a bare-placeholder template into literals and names, once."""
+        segments = self._segment_cache.get(sql)
+        if segments is None:
+            parts = _SIMPLE_PLACEHOLDER.split(sql)
+            literals, names = parts[::2], parts[1::2]
+            if any(_JINJA_DELIMITERS.search(text) for text in literals) or any(
+                name in _JINJA_CONSTANTS for name in names
+            ):
+                parts = []
+            else:
+                escaped = [t.replace("{", "{{").replace("}", "}}") for t in literals]
+                self._format_strings[sql] = escaped[0] + "".join(
+                    f"{{{name}}}{text}" for name, text in zip(names, escaped[1:])
+                )
+            segments = self._segment_cache[sql] = tuple(parts)
+        return segments
+
+    def _substitute(self, segments: Tuple[str, ...], values: Dict[str, Any]) -> str:
+        """Render split segments the way Jinja renders bare placeholders."""
+        env_globals = self.env.globals
+        out = [segments[0]]
+        append = out.append
+        for i in range(1, len(segments), 2):
+            name = segments[i]
+            if name in values:
+                append(str(values[name]))
+            elif name in env_globals:
+                append(str(env_globals[name]))
+            # Unknown names render as empty strings, like Jinja's Undefined
+            append(segments[i + 1])
+        return "".join(out)
+
+    def _find_undeclared_variables(self, sql: str) -> FrozenSet[str]:
+        """Parse ``sql`` and return the variables it reads but never sets."""
+        return frozenset(meta.find_undeclared_variables(self.env.parse(sql)))
+
     def validate_sql(self, sql: str) -> bool:
         """
         Validate SQL template syntax.
@@ -159,11 +298,8 @@ class SQLFormatter:
             True if valid, False otherwise
         """
         try:
-            # Parse the template to check syntax
-            ast = self.env.parse(sql)
-
-            # Extract undefined variables
-            undefined = meta.find_undeclared_variables(ast)
+            # Parse the template to check syntax and extract undefined variables
+            undefined = self._undeclared_variables(sql)
 
             if undefined:
                 logger.warning(f"Template has undefined variables: {undefined}")
@@ -184,18 +320,22 @@ class SQLFormatter:
             List of variable names
         """
         try:
-            ast = self.env.parse(sql)
-            return list(meta.find_undeclared_variables(ast))
+            return list(self._undeclared_variables(sql))
         except TemplateSyntaxError:
             return []
 
     def clear_generators(self):
         """Clear all registered generators."""
         self.generators.clear()
+        self._generator_items = ()
 
     def clear_static_params(self):
         """Clear all static parameters."""
+        for name in self.static_params:
+            self.env.globals.pop(name, None)
         self.static_params.clear()
+        # A static param may have shadowed one of the utility functions
+        self._setup_default_globals()
 
 
 class DynamicValueGenerator:
@@ -203,6 +343,8 @@ class DynamicValueGenerator:
 
     def __init__(self, seed: Optional[int] = None):
         self.random = random.Random(seed)
+        # Vectorised RNG backing the batch_* and make_*_generator helpers
+        self.rng = np.random.default_rng(seed)
 
     def random_int(self, min_val: int = 1, max_val: int = 1000000) -> int:
         """Generate a random integer."""
@@ -218,6 +360,69 @@ class DynamicValueGenerator:
             charset = string.ascii_letters + string.digits
         return "".join(self.random.choices(charset, k=length))
 
+    def batch_random_ints(
+        self, min_val: int = 1, max_val: int = 1000000, n: int = 4096
+    ) -> np.ndarray:
+        """Generate ``n`` random integers in ``[min_val, max_val]`` at once."""
+        return self.rng.integers(min_val, max_val, size=n, endpoint=True)
+
+    def batch_random_floats(
+        self, min_val: float = 0.0, max_val: float = 1000.0, n: int = 4096
+    ) -> np.ndarray:
+        """Generate ``n`` random floats in ``[min_val, max_val)`` at once."""
+        return self.rng.uniform(min_val, max_val, size=n)
+
+    def make_int_generator(
+        self, min_val: int = 1, max_val: int = 1000000, batch: int = 4096
+    ) -> Callable[[], int]:
+        """Create a random integer generator backed by a refilled batch."""
+        return self._batched(
+            lambda: self.batch_random_ints(min_val, max_val, batch).tolist()
+        )
+
+    def make_float_generator(
+        self, min_val: float = 0.0, max_val: float = 1000.0, batch: int = 4096
+    ) -> Callable[[], float]:
+        """Create a random float generator backed by a refilled batch."""
+        return self._batched(
+            lambda: self.batch_random_floats(min_val, max_val, batch).tolist()
+        )
+
+    def batch_random_strings(
+        self, length: int = 10, charset: str = None, n: int = 4096
+    ) -> List[str]:
+        """Generate ``n`` random ASCII strings of ``length`` characters at once."""
+        if charset is None:
+            charset = string.ascii_letters + string.digits
+        if not charset.isascii():
+            raise ValueError("Batched random strings require an ASCII charset")
+        chars = np.frombuffer(charset.encode("ascii"), dtype=np.uint8)
+        rows = chars[self.rng.integers(0, len(chars), size=(n, length))]
+        text = rows.tobytes().decode("ascii")
+        return [text[i : i + length] for i in range(0, n * length, length)]
+
+    def make_string_generator(
+        self, length: int = 10, charset: str = None, batch: int = 4096
+    ) -> Callable[[], str]:
+        """Create a random string generator backed by a refilled batch."""
+        return self._batched(lambda: self.batch_random_strings(length, charset, batch))
+
+    @staticmethod
+    def _batched(refill: Callable[[], List[Any]]) -> Callable[[], Any]:
+        """Hand out values one at a time from batches produced by ``refill``."""
+        state = {"buffer": [], "index": 0}
+
+        def generator():
+            index = state["index"]
+            buffer = state["buffer"]
+            if index >= len(buffer):
+                buffer = state["buffer"] = refill()
+                index = 0
+            state["index"] = index + 1
+            return buffer[index]
+
+        return generator
+
     def random_email(self) -> str:
         """Generate a random email address."""
         username = self.random_string(8)
@@ -228,10 +433,12 @@ class DynamicValueGenerator:
         self, start_date: datetime = None, end_date: datetime = None
     ) -> datetime:
         """Generate a random date between start and end."""
-        if start_date is None:
-            start_date = datetime.now() - timedelta(days=365)
-        if end_date is None:
-            end_date = datetime.now()
+        if start_date is None or end_date is None:
+            now = datetime.now()
+            if start_date is None:
+                start_date = now - timedelta(days=365)
+            if end_date is None:
+                end_date = now
 
         time_delta = end_date - start_date
         random_days = self.random.randint(0, time_delta.days)
@@ -239,15 +446,8 @@ class DynamicValueGenerator:
 
     def random_uuid(self) -> str:
         """Generate a random UUID-like string."""
-        return "-".join(
-            [
-                self.random_string(8),
-                self.random_string(4),
-                self.random_string(4),
-                self.random_string(4),
-                self.random_string(12),
-            ]
-        )
+        h = f"{self.random.getrandbits(128):032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
     def random_choice(self, choices: List[Any]) -> Any:
         """Choose a random item from a list."""
@@ -259,23 +459,31 @@ class DynamicValueGenerator:
         weights = list(choices.values())
         return self.random.choices(items, weights=weights)[0]
 
-    def sequential_id(self, start: int = 1) -> Callable[[], int]:
-        """Create a sequential ID generator."""
-        counter = {"value": start - 1}
+    def make_weighted_choice(self, choices: Dict[Any, float]) -> Callable[[], Any]:
+        """Create a weighted choice generator with precomputed cumulative weights."""
+        items = tuple(choices.keys())
+        cum_weights = list(itertools.accumulate(choices.values()))
+        if not cum_weights or cum_weights[-1] <= 0:
+            raise ValueError("Weighted choice needs at least one positive weight")
+        total = cum_weights[-1]
+        rand = self.random.random
+        hi = len(cum_weights) - 1
 
         def generator():
-            counter["value"] += 1
-            return counter["value"]
+            return items[bisect.bisect_right(cum_weights, rand() * total, 0, hi)]
 
         return generator
 
+    def sequential_id(self, start: int = 1) -> Callable[[], int]:
+        """Create a sequential ID generator."""
+        return itertools.count(start).__next__
+
     def hash_based_id(self, prefix: str = "") -> Callable[[], str]:
         """Create a hash-based ID generator."""
-        counter = {"value": 0}
+        counter = itertools.count(1)
 
         def generator():
-            counter["value"] += 1
-            value = f"{prefix}{counter['value']}{datetime.now().timestamp()}"
-            return hashlib.md5(value.encode()).hexdigest()[:16]
+            value = f"{prefix}{next(counter)}{time.time_ns()}"
+            return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
 
         return generator
@@ -0,0 +1,95 @@
+import asyncio
+
+import asyncpg
+import pytest
+
+from pgbenchmark.benchmarks.async_bench import AsyncBenchmark, _to_positional
+from pgbenchmark.core.base import BenchmarkConfig
+from pgbenchmark.core.exceptions import ConnectionError
+
+
+def test_to_positional_numbers_each_parameter_once():
+    sql, args = _to_positional(
+        "SELECT * FROM t WHERE a = {a} AND b = {b} OR a > {a}", {"a": 1, "b": "x"}
+    )
+    assert sql == "SELECT * FROM t WHERE a = $1 AND b = $2 OR a > $1"
+    assert args == (1, "x")
+
+
+def test_to_positional_leaves_unknown_placeholders():
+    sql, args = _to_positional("SELECT '{json}', {id}", {"id": 5})
+    assert sql == "SELECT '{json}', $1"
+    assert args == (5,)
+
+
+def test_to_positional_binds_quoted_placeholders_as_text():
+    sql, args = _to_positional(
+        "SELECT * FROM t WHERE name = '{name}' AND id = {id} AND code = '{id}'",
+        {"name": "x", "id": 1},
+    )
+    assert sql == "SELECT * FROM t WHERE name = $1 AND id = $2 AND code = $3"
+    assert args == ("x", 1, "1")
+
+
+def test_to_positional_inlines_placeholders_inside_longer_literals(caplog):
+    sql, args = _to_positional(
+        "SELECT 1 WHERE name LIKE '%{name}%' AND id = {id}", {"name": "o'k", "id": 2}
+    )
+    assert sql == "SELECT 1 WHERE name LIKE '%o''k%' AND id = $1"
+    assert args == (2,)
+    assert "substituted as text" in caplog.text
+
+
+def test_execute_query_does_not_retry_syntax_errors():
+    attempts = []
+
+    class FakeConnection:
+        async def fetch(self, sql, *args):
+            attempts.append(sql)
+            raise asyncpg.PostgresSyntaxError("syntax error at or near")
+
+    class FakeAcquire:
+        async def __aenter__(self):
+            return FakeConnection()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakePool:
+        def acquire(self):
+            return FakeAcquire()
+
+    benchmark = AsyncBenchmark({}, BenchmarkConfig(retry_on_error=3))
+    benchmark.set_sql("SELEC 1")
+    benchmark._pool = FakePool()
+    benchmark._mark_time_base()
+
+    execution = asyncio.run(benchmark._execute_query(0))
+
+    assert not execution.success
+    assert len(attempts) == 1
+
+
+def test_create_pool_merges_caller_server_settings(monkeypatch):
+    created = {}
+
+    async def fake_create_pool(**kwargs):
+        created.update(kwargs)
+        raise OSError("no server")
+
+    monkeypatch.setattr(asyncpg, "create_pool", fake_create_pool)
+    benchmark = AsyncBenchmark(
+        {"server_settings": {"application_name": "bench"}},
+        BenchmarkConfig(timeout=2),
+    )
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(benchmark._create_pool())
+
+    assert created["server_settings"] == {
+        "application_name": "bench",
+        "statement_timeout": "2000",
+    }
+    assert benchmark.connection_params["server_settings"] == {
+        "application_name": "bench"
+    }
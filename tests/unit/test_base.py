@@ -0,0 +1,26 @@
+from pgbenchmark.core.base import _read_sql_file, is_read_only_sql, load_sql
+
+
+def test_load_sql_reads_files(tmp_path):
+    path = tmp_path / "query.sql"
+    path.write_text("SELECT 42;")
+
+    assert load_sql(str(path)) == "SELECT 42;"
+    assert _read_sql_file.cache_info().currsize >= 1
+
+
+def test_load_sql_passes_queries_through():
+    assert load_sql("SELECT 1;") == "SELECT 1;"
+    assert load_sql("SELECT 1\nFROM t") == "SELECT 1\nFROM t"
+
+
+def test_is_read_only_sql():
+    assert is_read_only_sql("  select * from t")
+    assert is_read_only_sql("EXPLAIN SELECT 1")
+    assert not is_read_only_sql("INSERT INTO t VALUES (1)")
+    assert not is_read_only_sql("selected_rows")
+    assert not is_read_only_sql("SELECT * FROM t FOR UPDATE")
+    assert not is_read_only_sql("select * from t for no key update")
+    assert not is_read_only_sql("SELECT * FROM t FOR KEY SHARE")
+    assert not is_read_only_sql("SELECT * INTO t2 FROM t")
+    assert not is_read_only_sql("EXPLAIN ANALYZE DELETE FROM t")
@@ -0,0 +1,21 @@
+from pgbenchmark.config import Config
+
+
+def test_env_overrides_are_coerced_and_not_shared(monkeypatch):
+    monkeypatch.setenv("PGBENCH_PORT", "6543")
+    monkeypatch.setenv("PGBENCH_HOST", "db.internal")
+
+    config = Config()
+
+    assert config.get("database", "port") == 6543
+    assert config.get("database", "host") == "db.internal"
+    assert Config.DEFAULT_CONFIG["database"]["port"] == 5432
+
+
+def test_get_returns_none_for_missing_entries():
+    config = Config()
+
+    assert config.get("database", "missing") is None
+    assert config.get("missing", "host") is None
+    config.set("custom", "key", 1)
+    assert config.get("custom", "key") == 1
@@ -0,0 +1,141 @@
+import psycopg2
+import psycopg2.pool
+import pytest
+
+from pgbenchmark.core.connection import ConnectionManager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.queries.append(query)
+        if self.conn.fail:
+            self.conn.fail = False
+            self.conn.closed = 2
+            raise psycopg2.OperationalError("server closed the connection")
+
+    description = None
+
+    def mogrify(self, query, params=None):
+        return (query % params if params else query).encode()
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+        self.closed = 0
+        self.fail = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakePool:
+    def __init__(self, minconn, maxconn, **params):
+        self.conn = FakeConnection()
+        self.returned = []
+        self.discarded = 0
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        self.returned.append(conn)
+        self.discarded += close
+        if close:
+            self.conn = FakeConnection()
+
+    def closeall(self):
+        pass
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(psycopg2.pool, "ThreadedConnectionPool", FakePool)
+    return ConnectionManager({"dbname": "test"})
+
+
+def test_pooled_connection_is_returned(manager):
+    with manager.get_connection() as conn:
+        assert conn is manager._pool.conn
+    assert manager._pool.returned == [conn]
+
+
+def test_errors_inside_block_propagate(manager):
+    with pytest.raises(ZeroDivisionError):
+        with manager.get_connection():
+            1 / 0
+    assert len(manager._pool.returned) == 1
+
+
+def test_checkout_does_not_probe_by_default(manager):
+    with manager.get_connection() as conn:
+        pass
+    assert conn.queries == []
+
+    with manager.get_connection(validate=True) as conn:
+        pass
+    assert conn.queries == ["SELECT 1"]
+
+
+def test_execute_query_retries_once_on_a_dropped_connection(manager):
+    broken = manager._pool.conn
+    broken.fail = True
+
+    assert manager.execute_query("UPDATE t SET x = 1") is None
+
+    assert manager._pool.discarded == 1
+    assert manager._pool.conn is not broken
+    assert manager._pool.conn.queries == ["UPDATE t SET x = 1"]
+
+
+def test_pipeline_execute_sends_one_batch(manager):
+    manager.pipeline_execute("UPDATE t SET x = %s;", (1,), count=3)
+
+    assert manager._pool.conn.queries == [
+        b"UPDATE t SET x = 1;UPDATE t SET x = 1;UPDATE t SET x = 1"
+    ]
+
+
+def test_execute_prepared_prepares_once_per_connection(manager):
+    for value in (1, 2):
+        manager.execute_prepared("get_user", "SELECT * FROM u WHERE id = $1", (value,))
+    manager.execute_prepared("get_user", "SELECT * FROM u WHERE id = $2", (3,))
+
+    assert manager._pool.conn.queries == [
+        "PREPARE get_user AS SELECT * FROM u WHERE id = $1",
+        "EXECUTE get_user (%s)",
+        "EXECUTE get_user (%s)",
+        "DEALLOCATE get_user",
+        "PREPARE get_user AS SELECT * FROM u WHERE id = $2",
+        "EXECUTE get_user (%s)",
+    ]
+
+
+def test_connection_info_uses_one_query(manager, monkeypatch):
+    conn = manager._pool.conn
+    conn.encoding = "UTF8"
+    conn.isolation_level = 1
+    monkeypatch.setattr(
+        FakeCursor,
+        "fetchone",
+        lambda self: ("PostgreSQL 16", "bench", "postgres"),
+        raising=False,
+    )
+
+    info = manager.get_connection_info()
+
+    assert conn.queries == ["SELECT version(), current_database(), current_user"]
+    assert (info["server_version"], info["database"], info["user"]) == (
+        "PostgreSQL 16",
+        "bench",
+        "postgres",
+    )
@@ -0,0 +1,280 @@
+import json
+import pickle
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pgbenchmark.core import metrics
+from pgbenchmark.core.metrics import MetricsCollector, P2Quantile, QueryExecution
+
+
+def test_wall_time_requires_start():
+    collector = MetricsCollector()
+    with pytest.raises(RuntimeError):
+        collector.wall_time(time.perf_counter_ns())
+
+
+def test_wall_time_offsets_from_start():
+    collector = MetricsCollector()
+    collector.start()
+    base = collector._start_perf_ns
+
+    assert collector.wall_time(base) == collector._start_time
+    assert collector.wall_time(base + 2_500_000) - collector._start_time == timedelta(
+        microseconds=2500
+    )
+
+
+def _execution(run_id, duration_ms, success=True):
+    now = datetime.now()
+    return QueryExecution(
+        run_id=run_id,
+        start_time=now,
+        end_time=now,
+        duration_ns=int(duration_ms * 1_000_000),
+        success=success,
+    )
+
+
+def test_p2_quantile_tracks_exact_percentiles():
+    data = np.random.default_rng(7).lognormal(size=20_000)
+    for p in (25, 50, 90, 99):
+        estimator = P2Quantile(p)
+        for x in data:
+            estimator.add(x)
+        assert estimator.value() == pytest.approx(np.percentile(data, p), rel=0.05)
+
+
+def test_streaming_collector_matches_kept_executions():
+    durations = np.random.default_rng(3).uniform(0.1, 20.0, size=500)
+    kept = MetricsCollector()
+    streamed = MetricsCollector(keep_executions=False)
+    for collector in (kept, streamed):
+        collector.start()
+        for i, d in enumerate(durations):
+            collector.add_execution(_execution(i, d))
+        collector.add_execution(_execution(len(durations), 0, success=False))
+        collector.end()
+
+    expected = kept.get_result()
+    result = streamed.get_result()
+
+    assert result.executions == []
+    assert streamed.total_runs == expected.total_runs == 501
+    assert result.failed_runs == expected.failed_runs == 1
+    assert result.avg_time_ms == pytest.approx(expected.avg_time_ms)
+    assert result.stddev_time_ms == pytest.approx(expected.stddev_time_ms)
+    assert result.min_time_ms == pytest.approx(expected.min_time_ms)
+    assert result.max_time_ms == pytest.approx(expected.max_time_ms)
+    assert result.latency_distribution == expected.latency_distribution
+    assert len(result.streaming_stats.samples) == 500
+
+
+def test_result_exposes_columnar_durations():
+    collector = MetricsCollector()
+    collector.start()
+    collector.add_execution(_execution(0, 2.0))
+    collector.add_execution(_execution(1, 5.0, success=False))
+    collector.add_execution(_execution(2, 4.0))
+    collector.end()
+
+    result = collector.get_result()
+
+    assert list(result.durations_ns) == [2_000_000, 5_000_000, 4_000_000]
+    assert list(result.success_mask) == [1, 0, 1]
+    assert result.successful_durations() == pytest.approx([2.0, 4.0])
+    assert result.avg_time_ms == pytest.approx(3.0)
+
+
+def test_query_execution_pickles_compactly():
+    now = datetime.now()
+    execution = QueryExecution(
+        run_id=7,
+        start_time=now,
+        end_time=now,
+        duration_ns=1234,
+        success=False,
+        error="boom",
+        buffer_stats={"blks_hit": 3},
+    )
+
+    restored = pickle.loads(pickle.dumps(execution))
+
+    assert restored == execution
+    assert b"duration_ns" not in pickle.dumps(execution)
+
+
+@pytest.mark.parametrize("keep_executions", [True, False])
+def test_add_executions_matches_add_execution(keep_executions):
+    now = datetime.now()
+    executions = [
+        QueryExecution(
+            run_id=i,
+            start_time=now,
+            end_time=now,
+            duration_ns=(i + 1) * 1_000_000,
+            success=i % 3 != 0,
+        )
+        for i in range(10)
+    ]
+    one_by_one = MetricsCollector(keep_executions=keep_executions)
+    batched = MetricsCollector(keep_executions=keep_executions)
+    for collector in (one_by_one, batched):
+        collector.start()
+    for execution in executions:
+        one_by_one.add_execution(execution)
+    batched.add_executions(iter(executions))
+    for collector in (one_by_one, batched):
+        collector.end()
+
+    expected, result = one_by_one.get_result(), batched.get_result()
+    assert result.successful_runs == expected.successful_runs == 6
+    assert result.avg_time_ms == pytest.approx(expected.avg_time_ms)
+    assert result.percentiles == pytest.approx(expected.percentiles)
+
+
+@pytest.mark.parametrize("keep_columns", [True, False])
+def test_result_statistics_match_reference(keep_columns):
+    durations = [0.5, 1.0, 4.999, 5.0, 12.0, 250.0, 5000.0, 7.5]
+    collector = MetricsCollector()
+    collector.start()
+    for i, d in enumerate(durations):
+        collector.add_execution(_execution(i, d))
+    collector.add_execution(_execution(len(durations), 99.0, success=False))
+    collector.end()
+    result = collector.get_result()
+    if not keep_columns:
+        result = replace(result, durations_ns=None, success_mask=None)
+
+    ordered = sorted(durations)
+    assert result.min_time_ms == pytest.approx(0.5)
+    assert result.max_time_ms == pytest.approx(5000.0)
+    assert result.median_time_ms == pytest.approx(np.median(durations))
+    assert result.stddev_time_ms == pytest.approx(np.std(durations, ddof=1))
+    assert result.percentiles["p90"] == pytest.approx(ordered[int(len(ordered) * 0.9)])
+    assert result.latency_distribution == {
+        "<1ms": 1,
+        "1-5ms": 2,
+        "5-10ms": 2,
+        "10-50ms": 1,
+        "50-100ms": 0,
+        "100-500ms": 1,
+        "500ms-1s": 0,
+        "1s-5s": 0,
+        ">5s": 1,
+    }
+    json.loads(result.to_json())
+
+
+def test_statistics_are_computed_on_first_access():
+    collector = MetricsCollector()
+    collector.start()
+    for i, d in enumerate([3.0, 1.0, 2.0]):
+        collector.add_execution(_execution(i, d))
+    collector.end()
+    result = collector.get_result()
+
+    assert "percentiles" not in vars(result)
+    result.get_summary()
+    assert "percentiles" not in vars(result)
+    assert result.percentiles["p50"] == pytest.approx(2.0)
+    assert "percentiles" in vars(result)
+
+
+@pytest.mark.parametrize("keep_executions", [True, False])
+def test_current_stats_use_running_accumulators(keep_executions):
+    durations = [4.0, 1.0, 7.0, 2.0]
+    collector = MetricsCollector(keep_executions=keep_executions)
+    collector.start()
+    collector.add_executions(_execution(i, d) for i, d in enumerate(durations[:2]))
+    for i, d in enumerate(durations[2:], start=2):
+        collector.add_execution(_execution(i, d))
+    collector.add_execution(_execution(4, 0, success=False))
+
+    stats = collector.get_current_stats()
+
+    assert stats["total_runs"] == 5
+    assert stats["successful_runs"] == 4
+    assert stats["failed_runs"] == 1
+    assert stats["current_avg_ms"] == pytest.approx(np.mean(durations))
+    assert stats["current_min_ms"] == pytest.approx(1.0)
+    assert stats["current_max_ms"] == pytest.approx(7.0)
+    assert stats["current_stddev_ms"] == pytest.approx(np.std(durations, ddof=1))
+
+
+def test_query_execution_has_no_instance_dict():
+    assert not hasattr(_execution(0, 1.0), "__dict__")
+
+
+def test_to_json_matches_stdlib_encoder(monkeypatch):
+    pytest.importorskip("orjson")
+    collector = MetricsCollector()
+    collector.start()
+    for i, d in enumerate([1.5, 3.0, 0.2]):
+        collector.add_execution(_execution(i, d))
+    collector.end()
+    result = collector.get_result()
+
+    fast = result.to_json(include_executions=True)
+    monkeypatch.setattr(metrics, "orjson", None)
+
+    assert json.loads(fast) == json.loads(result.to_json(include_executions=True))
+
+
+@pytest.mark.parametrize(
+    "duration_ms, bucket",
+    [
+        (0.0, "<1ms"),
+        (0.999, "<1ms"),
+        (1.0, "1-5ms"),
+        (999.9, "500ms-1s"),
+        (5000, ">5s"),
+    ],
+)
+def test_latency_bucket_boundaries(duration_ms, bucket):
+    assert metrics._latency_bucket(duration_ms) == bucket
+
+
+def test_fused_statistics_match_numpy(monkeypatch):
+    pytest.importorskip("numba")
+    durations = np.random.default_rng(11).lognormal(mean=1.0, size=2000)
+    collector = MetricsCollector()
+    collector.start()
+    for i, d in enumerate(durations):
+        collector.add_execution(_execution(i, d))
+    collector.end()
+    expected = collector.get_result()
+    assert expected._fused is None
+
+    monkeypatch.setattr(metrics, "_FUSED_STATS_MIN_SIZE", 1000)
+    result = collector.get_result()
+
+    assert result._fused is not None
+    for name in ("min_time_ms", "max_time_ms", "avg_time_ms", "stddev_time_ms"):
+        assert getattr(result, name) == pytest.approx(getattr(expected, name))
+    assert result.latency_distribution == expected.latency_distribution
+    assert result.percentiles == expected.percentiles
+
+
+def test_packed_buffers_feed_a_streaming_collector():
+    executions = [_execution(i, d) for i, d in enumerate([1.0, 2.0, 3.0])]
+    executions.append(_execution(3, 50.0, success=False))
+    collector = MetricsCollector(keep_executions=False)
+    collector.start()
+    collector.add_buffer(metrics.pack_executions(executions[:2]))
+    collector.add_buffer(metrics.pack_executions(executions[2:]))
+    collector.end()
+
+    result = collector.get_result()
+
+    assert (result.total_runs, result.successful_runs) == (4, 3)
+    assert result.avg_time_ms == pytest.approx(2.0)
+    assert result.max_time_ms == pytest.approx(3.0)
+
+    with pytest.raises(ValueError):
+        kept = MetricsCollector()
+        kept.start()
+        kept.add_buffer(metrics.pack_executions(executions))
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pgbenchmark
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, pgbenchmark; "
+        "print(any(m in sys.modules for m in ('scipy', 'asyncpg', 'psutil')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_lazy_exports_resolve():
+    from pgbenchmark.analyzers.statistics import StatisticalAnalyzer
+
+    assert pgbenchmark.StatisticalAnalyzer is StatisticalAnalyzer
+    assert "AsyncBenchmark" in dir(pgbenchmark)
@@ -0,0 +1,114 @@
+import multiprocessing as mp
+from datetime import datetime
+
+import pytest
+
+from pgbenchmark.benchmarks import parallel
+from pgbenchmark.core.base import BenchmarkConfig
+from pgbenchmark.core.metrics import QueryExecution
+
+pytestmark = pytest.mark.skipif(
+    mp.get_start_method() != "fork", reason="fakes reach workers only via fork"
+)
+
+
+class FakeConnectionManager:
+    def __init__(self, connection_params):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSingleThreadBenchmark:
+    def __init__(self, conn_manager, config):
+        self.config = config
+
+    def set_sql(self, sql, params=None):
+        pass
+
+    def iter_results(self):
+        now = datetime.now()
+        for run_id in range(self.config.number_of_runs):
+            yield QueryExecution(
+                run_id=run_id,
+                start_time=now,
+                end_time=now,
+                duration_ns=1000,
+                success=True,
+            )
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_iter_results_streams_batched_executions(monkeypatch, backend):
+    monkeypatch.setattr(parallel, "ConnectionManager", FakeConnectionManager)
+    monkeypatch.setattr(parallel, "SingleThreadBenchmark", FakeSingleThreadBenchmark)
+    config = BenchmarkConfig(number_of_runs=45, warmup_runs=0)
+    benchmark = parallel.ParallelBenchmark(
+        {}, num_processes=2, config=config, backend=backend
+    )
+    benchmark.set_sql("SELECT 1")
+
+    gen = benchmark.iter_results()
+    run_ids = []
+    try:
+        while True:
+            run_ids.append(next(gen).run_id)
+    except StopIteration as stop:
+        result = stop.value
+
+    assert sorted(run_ids) == list(range(45))
+    assert result.total_runs == 45
+    assert not benchmark.get_status()["is_running"]
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_run_combines_worker_results(monkeypatch, backend):
+    monkeypatch.setattr(parallel, "ConnectionManager", FakeConnectionManager)
+    monkeypatch.setattr(parallel, "SingleThreadBenchmark", FakeSingleThreadBenchmark)
+    config = BenchmarkConfig(number_of_runs=30, warmup_runs=0)
+    benchmark = parallel.ParallelBenchmark(
+        {}, num_processes=2, config=config, backend=backend
+    )
+    benchmark.set_sql("SELECT 1")
+
+    result = benchmark.run()
+
+    assert sorted(e.run_id for e in result.executions) == list(range(30))
+    assert result.successful_runs == 30
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_run_ships_packed_buffers_without_executions(monkeypatch, backend):
+    monkeypatch.setattr(parallel, "ConnectionManager", FakeConnectionManager)
+    monkeypatch.setattr(parallel, "SingleThreadBenchmark", FakeSingleThreadBenchmark)
+    config = BenchmarkConfig(number_of_runs=30, warmup_runs=0, keep_executions=False)
+    benchmark = parallel.ParallelBenchmark(
+        {}, num_processes=2, config=config, backend=backend
+    )
+    benchmark.set_sql("SELECT 1")
+
+    result = benchmark.run()
+
+    assert result.executions == []
+    assert result.total_runs == result.successful_runs == 30
+    assert result.avg_time_ms == pytest.approx(0.001)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        parallel.ParallelBenchmark({}, backend="fiber")
+
+
+def test_work_distribution_is_even_and_cached():
+    benchmark = parallel.ParallelBenchmark(
+        {},
+        num_processes=3,
+        config=BenchmarkConfig(number_of_runs=10, warmup_runs=4),
+        backend="thread",
+    )
+
+    distribution = benchmark._calculate_work_distribution()
+
+    assert distribution == ((0, 4, 2, 0), (1, 3, 1, 4), (2, 3, 1, 7))
+    assert benchmark._calculate_work_distribution() is distribution
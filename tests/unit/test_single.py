@@ -0,0 +1,279 @@
+import weakref
+from contextlib import contextmanager
+
+import psycopg2
+import pytest
+
+from pgbenchmark.benchmarks.single import SingleThreadBenchmark
+from pgbenchmark.core.base import BenchmarkConfig
+from pgbenchmark.core.connection import ConnectionManager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rowcount = -1
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+        if sql == self.conn.fail_with:
+            raise psycopg2.extensions.QueryCanceledError("canceling statement")
+        if sql.startswith("EXPLAIN"):
+            plan = {"Shared Hit Blocks": 7, "Shared Read Blocks": 3, "Plans": []}
+            self._row = ([{"Plan": plan}],)
+        elif "pg_stat_database" in sql:
+            self.conn.stat_reads += 1
+            n = self.conn.stat_reads
+            self._row = (10 * n, 100 * n, 1000 * n, 5 * n)
+            self.description = [("col",)] * 4
+        else:
+            self._row = (1,)
+            self.description = [("?column?",)]
+        self.rowcount = 1
+
+    def fetchone(self):
+        return self._row
+
+    def fetchall(self):
+        return [self._row]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.stat_reads = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+        self.fail_with = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeConnectionManager:
+    # Share the real bookkeeping for prepared statements
+    prepare_statement = ConnectionManager.prepare_statement
+
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.checkouts = 0
+        self._prepared = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def get_connection(self):
+        self.checkouts += 1
+        yield self.conn
+
+
+def _benchmark(**config):
+    config.setdefault("warmup_runs", 0)
+    manager = FakeConnectionManager()
+    benchmark = SingleThreadBenchmark(manager, BenchmarkConfig(**config))
+    return benchmark, manager.conn
+
+
+def test_buffer_stats_are_deltas_of_selected_columns():
+    benchmark, conn = _benchmark(number_of_runs=1, collect_buffers=True)
+    benchmark.set_sql("SELECT 1")
+
+    result = benchmark.run()
+
+    assert result.executions[0].buffer_stats == {
+        "blks_read": 10,
+        "blks_hit": 100,
+        "tup_returned": 1000,
+        "tup_fetched": 5,
+    }
+    assert not any("SELECT *" in sql for sql in conn.statements)
+
+
+def test_buffer_stats_come_from_explain_plan_when_collected():
+    benchmark, conn = _benchmark(
+        number_of_runs=2, collect_buffers=True, collect_explain=True
+    )
+    benchmark.set_sql("SELECT 1")
+
+    result = benchmark.run()
+
+    assert result.executions[0].buffer_stats == {
+        "shared_hit_blocks": 7,
+        "shared_read_blocks": 3,
+        "shared_dirtied_blocks": 0,
+        "shared_written_blocks": 0,
+    }
+    assert conn.stat_reads == 0
+
+
+def test_commit_after_each_commits_every_statement():
+    # A SELECT may call a function that writes, so it commits as well
+    benchmark, conn = _benchmark(number_of_runs=3, commit_after_each=True)
+    benchmark.set_sql("SELECT my_write_fn()")
+    benchmark.run()
+    assert (conn.commits, conn.rollbacks) == (3, 0)
+
+    benchmark, conn = _benchmark(number_of_runs=3, commit_after_each=True)
+    benchmark.set_sql("INSERT INTO t VALUES (1)")
+    benchmark.run()
+    assert conn.commits == 3
+
+
+def test_reads_end_their_transaction_each_run():
+    benchmark, conn = _benchmark(number_of_runs=3, warmup_runs=2)
+    benchmark.set_sql("SELECT now()")
+    benchmark.run()
+    assert (conn.commits, conn.rollbacks) == (0, 5)
+
+
+def test_writes_roll_back_each_run_by_default():
+    benchmark, conn = _benchmark(number_of_runs=3)
+    benchmark.set_sql("INSERT INTO t VALUES (1)")
+    benchmark.run()
+    assert (conn.commits, conn.rollbacks) == (0, 3)
+
+
+def test_one_connection_is_held_for_the_whole_run():
+    benchmark, _ = _benchmark(number_of_runs=10, warmup_runs=3)
+    benchmark.set_sql("SELECT 1")
+
+    list(benchmark.iter_results())
+    benchmark.run()
+
+    assert benchmark.connection_manager.checkouts == 2
+
+
+def test_static_sql_is_rendered_once(monkeypatch):
+    benchmark, conn = _benchmark(number_of_runs=5)
+    benchmark.set_sql("SELECT {{ x }}", {"x": 1})
+    calls = []
+    original = benchmark.sql_formatter.format
+    monkeypatch.setattr(
+        benchmark.sql_formatter,
+        "format",
+        lambda *args: calls.append(args) or original(*args),
+    )
+
+    benchmark.run()
+
+    assert len(calls) == 1
+    name = benchmark._statement_name
+    assert conn.statements == [f"PREPARE {name} AS SELECT 1"] + [f"EXECUTE {name}"] * 5
+
+
+def test_prepared_statements_are_tracked_by_the_connection_manager():
+    benchmark, conn = _benchmark(number_of_runs=2)
+    benchmark.set_sql("SELECT 1")
+
+    benchmark.run()
+    benchmark.run()
+
+    name = benchmark._statement_name
+    assert benchmark.connection_manager._prepared[conn] == {name: "SELECT 1"}
+    assert conn.statements.count(f"PREPARE {name} AS SELECT 1") == 1
+
+
+def test_prepared_statements_can_be_disabled():
+    benchmark, conn = _benchmark(number_of_runs=2, use_prepared=False)
+    benchmark.set_sql("SELECT 1")
+
+    benchmark.run()
+
+    assert conn.statements == ["SELECT 1"] * 2
+
+
+def test_multi_statement_sql_is_not_prepared():
+    benchmark, conn = _benchmark(number_of_runs=2)
+    benchmark.set_sql("SELECT 1; SELECT 2;")
+
+    benchmark.run()
+
+    assert conn.statements == ["SELECT 1; SELECT 2;"] * 2
+
+
+def test_generated_sql_is_rendered_per_run():
+    benchmark, conn = _benchmark(number_of_runs=3)
+    values = iter(range(3))
+    benchmark.sql_formatter.add_generator("x", lambda: next(values))
+    benchmark.set_sql("SELECT {{ x }}")
+
+    benchmark.run()
+
+    assert conn.statements == ["SELECT 0", "SELECT 1", "SELECT 2"]
+
+
+def test_plain_runs_send_only_the_benchmark_query():
+    benchmark, conn = _benchmark(number_of_runs=3, warmup_runs=2, use_prepared=False)
+    benchmark.set_sql("SELECT 1")
+
+    benchmark.run()
+
+    assert conn.statements == ["SELECT 1"] * 5
+
+
+def test_fetch_mode_skips_row_conversion(monkeypatch):
+    benchmark, _ = _benchmark(number_of_runs=2, fetch_mode="count")
+    benchmark.set_sql("SELECT 1")
+    monkeypatch.setattr(FakeCursor, "fetchall", lambda self: pytest.fail("fetched"))
+
+    result = benchmark.run()
+
+    assert result.successful_runs == 2
+
+
+def test_fetch_mode_is_validated():
+    with pytest.raises(ValueError):
+        BenchmarkConfig(fetch_mode="some").validate()
+
+
+def test_statement_timeout_is_set_once_per_session():
+    benchmark, conn = _benchmark(number_of_runs=3, timeout=2)
+    benchmark.set_sql("SELECT 1")
+
+    benchmark.run()
+
+    assert conn.statements.count("SET statement_timeout = %s") == 1
+    assert not any("SET LOCAL" in sql for sql in conn.statements)
+    assert conn.statements[-1] == "RESET statement_timeout"
+
+
+def test_query_timeout_is_not_retried():
+    benchmark, conn = _benchmark(
+        number_of_runs=1, timeout=1, retry_on_error=3, use_prepared=False
+    )
+    benchmark.set_sql("SELECT pg_sleep(5)")
+    conn.fail_with = "SELECT pg_sleep(5)"
+
+    result = benchmark.run()
+
+    assert conn.statements.count("SELECT pg_sleep(5)") == 1
+    assert not result.executions[0].success
+    assert result.executions[0].error.startswith("Query timeout")
+
+
+def test_session_runs_on_demand_over_one_connection():
+    benchmark, conn = _benchmark(number_of_runs=50, warmup_runs=5)
+    benchmark.set_sql("SELECT 1")
+
+    with benchmark.session() as execute:
+        assert benchmark._is_running
+        executions = [execute(run_id) for run_id in range(3)]
+
+    assert not benchmark._is_running
+    assert [e.run_id for e in executions] == [0, 1, 2]
+    assert all(e.success for e in executions)
+    assert benchmark.connection_manager.checkouts == 1
+    assert benchmark.metrics_collector.get_result().total_runs == 0
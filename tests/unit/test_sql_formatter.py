@@ -0,0 +1,189 @@
+from datetime import datetime
+
+from pgbenchmark.formatters.sql import (
+    DynamicValueGenerator,
+    SQLFormatter,
+    _collapse_whitespace,
+)
+
+
+def test_templates_are_compiled_once(monkeypatch):
+    formatter = SQLFormatter()
+    compiled = []
+    original = formatter.env.from_string
+    monkeypatch.setattr(
+        formatter.env,
+        "from_string",
+        lambda source: compiled.append(source) or original(source),
+    )
+
+    sql = "SELECT * FROM t WHERE id = {{ id | int }}"
+    assert formatter.format(sql, {"id": 1}) == "SELECT * FROM t WHERE id = 1"
+    assert formatter.format(sql, {"id": 2}) == "SELECT * FROM t WHERE id = 2"
+
+    assert compiled == [sql]
+
+
+def test_plain_sql_skips_jinja(monkeypatch):
+    formatter = SQLFormatter()
+    monkeypatch.setattr(formatter, "_compile", None)
+
+    assert formatter.format("SELECT  1\n  FROM t;") == "SELECT 1 FROM t;"
+    assert formatter.format("SELECT  1\n  FROM t;", {"x": 1}) == "SELECT 1 FROM t;"
+
+
+def test_utilities_and_parameter_priority():
+    formatter = SQLFormatter()
+    formatter.add_static_param("id", 1)
+    formatter.add_static_param("table", "t")
+    formatter.add_generator("id", lambda: 2)
+
+    sql = "SELECT {{ len(table) }} FROM {{ table }} WHERE id = {{ id }}"
+    assert formatter.format(sql) == "SELECT 1 FROM t WHERE id = 2"
+    assert formatter.format(sql, {"id": 3}) == "SELECT 1 FROM t WHERE id = 3"
+
+
+def test_generators_can_be_cleared():
+    formatter = SQLFormatter()
+    formatter.add_generator("id", lambda: 7)
+    assert formatter.format("SELECT {{ id }}") == "SELECT 7"
+
+    formatter.clear_generators()
+    assert formatter.format("SELECT {{ id }}", {"id": 8}) == "SELECT 8"
+
+
+def test_batched_generators_refill():
+    values = DynamicValueGenerator(seed=1)
+    ints = values.make_int_generator(5, 7, batch=3)
+    floats = values.make_float_generator(1.0, 2.0, batch=3)
+
+    drawn = [ints() for _ in range(10)]
+    assert all(type(v) is int and 5 <= v <= 7 for v in drawn)
+    assert all(
+        type(v) is float and 1.0 <= v < 2.0 for v in (floats() for _ in range(10))
+    )
+
+
+def test_batched_string_generator():
+    values = DynamicValueGenerator(seed=1)
+    strings = values.make_string_generator(4, "ab", batch=3)
+
+    drawn = [strings() for _ in range(10)]
+    assert all(len(v) == 4 and set(v) <= {"a", "b"} for v in drawn)
+
+
+def test_hash_based_ids_are_unique_hex():
+    ids = DynamicValueGenerator().hash_based_id("user")
+    drawn = {ids() for _ in range(100)}
+
+    assert len(drawn) == 100
+    assert all(len(v) == 16 and int(v, 16) >= 0 for v in drawn)
+
+
+def test_weighted_choice_generator_matches_random_choices():
+    choices = {"a": 1.0, "b": 0.0, "c": 3.0}
+    fast = DynamicValueGenerator(seed=3).make_weighted_choice(choices)
+    slow = DynamicValueGenerator(seed=3)
+
+    assert [fast() for _ in range(50)] == [
+        slow.weighted_choice(choices) for _ in range(50)
+    ]
+
+
+def test_bare_placeholders_match_jinja():
+    formatter = SQLFormatter()
+    formatter.add_generator("price", lambda: 9.5)
+    cases = [
+        "INSERT INTO p VALUES ('{{product_name}}', {{ price }}, {{ missing }})",
+        "SELECT '{}'::jsonb, '{a}', {{ price }}",
+        "SELECT {{ none }}, {{ price }}",
+        "SELECT {{ price | int }} {% if price %}x{% endif %}",
+    ]
+
+    for sql in cases:
+        params = {"product_name": "tea"}
+        expected = formatter.env.from_string(sql).render(price=9.5, **params)
+        assert formatter.format(sql, params) == " ".join(expected.split())
+
+    assert formatter._segments(cases[0])
+    assert formatter._segments(cases[1])
+    assert not formatter._segments(cases[2])
+    assert not formatter._segments(cases[3])
+
+
+def test_template_is_parsed_once_for_validation_and_variables(monkeypatch):
+    formatter = SQLFormatter()
+    parsed = []
+    original = formatter.env.parse
+    monkeypatch.setattr(
+        formatter.env, "parse", lambda source: parsed.append(source) or original(source)
+    )
+
+    sql = "SELECT {{ a }} FROM {{ b }}"
+    assert formatter.validate_sql(sql)
+    assert sorted(formatter.get_template_variables(sql)) == ["a", "b"]
+    assert not formatter.validate_sql("SELECT {{ a")
+    assert parsed == [sql, "SELECT {{ a"]
+
+
+def test_sql_list_escapes_by_type():
+    class Flag(int):
+        pass
+
+    stamp = datetime(2024, 1, 2, 3, 4, 5)
+    values = [None, True, False, 3, 1.5, stamp, Flag(7)]
+
+    assert SQLFormatter._sql_list(values) == (
+        "(NULL, TRUE, FALSE, 3, 1.5, '2024-01-02T03:04:05', 7)"
+    )
+
+
+def test_sql_like_pattern_escapes_wildcards():
+    assert SQLFormatter._sql_like_pattern("plain", prefix=True) == "'%plain'"
+    assert SQLFormatter._sql_like_pattern("5%_off", suffix=True) == "'5\\%\\_off%'"
+
+
+def test_random_uuid_shape():
+    value = DynamicValueGenerator(seed=5).random_uuid()
+
+    assert [len(part) for part in value.split("-")] == [8, 4, 4, 4, 12]
+    assert int(value.replace("-", ""), 16) >= 0
+
+
+def test_static_params_live_in_globals():
+    formatter = SQLFormatter()
+    formatter.add_static_param("len", 5)
+    formatter.add_static_param("table", "t")
+
+    assert (
+        formatter.format("SELECT {{ len | int }} FROM {{ table }}") == "SELECT 5 FROM t"
+    )
+    assert formatter.format("SELECT {{ len }} FROM {{ table }}") == "SELECT 5 FROM t"
+
+    formatter.clear_static_params()
+    assert "table" not in formatter.env.globals
+    assert formatter.format("SELECT {{ len('ab') }}") == "SELECT 2"
+
+
+def test_repeated_renders_reuse_collapsed_sql():
+    formatter = SQLFormatter()
+    formatter.add_generator("id", lambda: 1)
+    _collapse_whitespace.cache_clear()
+
+    for _ in range(3):
+        assert formatter.format("SELECT\n  {{ id }}") == "SELECT 1"
+
+    assert _collapse_whitespace.cache_info().hits == 2
+
+
+def test_whitespace_collapse_covers_all_whitespace():
+    sql = "\t SELECT\r\n{{ id }},\x0b\x0c'a b'  "
+    expected = "SELECT 1, 'a b'"
+
+    assert SQLFormatter().format(sql, {"id": 1}) == expected
+
+
+def test_sequential_id_counts_from_start():
+    ids = DynamicValueGenerator().sequential_id(5)
+
+    assert [ids(), ids(), ids()] == [5, 6, 7]
@@ -0,0 +1,131 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pgbenchmark.analyzers import statistics as st
+from pgbenchmark.analyzers.statistics import StatisticalAnalyzer
+from pgbenchmark.core.metrics import BenchmarkResult, MetricsCollector, QueryExecution
+
+
+def _make_result(durations_ms):
+    collector = MetricsCollector()
+    collector.start()
+    now = datetime.now()
+    for i, d in enumerate(durations_ms):
+        collector.add_execution(
+            QueryExecution(
+                run_id=i,
+                start_time=now,
+                end_time=now,
+                duration_ns=int(d * 1_000_000),
+                success=True,
+            )
+        )
+    collector.end()
+    return collector.get_result()
+
+
+@pytest.mark.parametrize("n", [2, 3, 10, 101, 1000])
+def test_summary_kernel_matches_numpy(n):
+    data = np.sort(np.random.default_rng(n).lognormal(size=n))
+    assert np.allclose(st._summary_kernel(data), st._summary_kernel_np(data))
+
+
+def test_analyze_matches_reference_statistics():
+    durations = [1.0, 1.2, 1.1, 0.9, 1.05, 1.15, 25.0, 0.95, 1.0, 1.3]
+    summary = StatisticalAnalyzer.analyze(_make_result(durations))
+    data = np.array(durations)
+
+    assert summary.mean == pytest.approx(data.mean())
+    assert summary.median == pytest.approx(np.median(data))
+    assert summary.std_dev == pytest.approx(data.std(ddof=1))
+    assert summary.variance == pytest.approx(data.var(ddof=1))
+    q1, q3 = np.percentile(data, [25, 75])
+    assert summary.iqr == pytest.approx(q3 - q1)
+    assert summary.mad == pytest.approx(np.median(np.abs(data - np.median(data))))
+    assert summary.outliers == pytest.approx([25.0])
+
+
+def test_analyze_requires_two_samples():
+    with pytest.raises(ValueError):
+        StatisticalAnalyzer.analyze(_make_result([1.0]))
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 11, 500])
+def test_mad_sorted_matches_numpy(n):
+    data = np.sort(np.random.default_rng(n).normal(size=n))
+    median = np.median(data)
+    expected = np.median(np.abs(data - median))
+    assert st._mad_sorted(data, median) == pytest.approx(expected)
+
+
+def test_mode_sorted_prefers_smallest_longest_run():
+    data = np.array([1.0, 2.0, 2.0, 3.0, 3.0, 4.0])
+    assert st._mode_sorted(data) == (2.0, 2)
+    assert st._mode_sorted_np(data) == (2.0, 2)
+
+
+@pytest.mark.parametrize("n", [5, 29, 30, 200])
+def test_confidence_interval_matches_scipy(n):
+    from scipy import stats
+
+    data = np.random.default_rng(n).normal(10, 2, size=n)
+    mean, std_dev = data.mean(), data.std(ddof=1)
+    low, high = StatisticalAnalyzer._confidence_interval(mean, std_dev, n, 0.95)
+
+    dist = stats.norm if n >= 30 else stats.t(n - 1)
+    margin = dist.ppf(0.975) * stats.sem(data)
+    assert (low, high) == pytest.approx((mean - margin, mean + margin))
+
+
+def test_analyze_in_background_matches_analyze():
+    result = _make_result([1.0, 1.2, 1.1, 0.9, 1.05, 1.15, 25.0, 0.95])
+    expected = StatisticalAnalyzer.analyze(result)
+
+    summary = StatisticalAnalyzer.analyze_in_background(result).result(timeout=60)
+
+    assert summary.mean == pytest.approx(expected.mean)
+    assert summary.outliers == pytest.approx(expected.outliers)
+
+
+def test_normality_subsamples_the_whole_run(monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        st.stats, "shapiro", lambda sample: seen.append(sample) or (1.0, 0.5)
+    )
+    # A long warm-up prefix followed by steady-state runs
+    data = np.concatenate([np.full(6000, 50.0), np.full(6000, 1.0)])
+
+    StatisticalAnalyzer._test_normality(data)
+
+    sample = seen[0]
+    assert len(sample) == 5000
+    assert 0 < np.count_nonzero(sample == 1.0) < 5000
+
+
+@pytest.mark.parametrize("successful_runs", [8, 12])
+def test_analyze_ignores_mismatched_success_count(successful_runs):
+    now = datetime.now()
+    executions = [
+        QueryExecution(
+            run_id=i,
+            start_time=now,
+            end_time=now,
+            duration_ns=(i + 1) * 1_000_000,
+            success=True,
+        )
+        for i in range(10)
+    ]
+    result = BenchmarkResult(
+        executions=executions,
+        total_runs=10,
+        successful_runs=successful_runs,
+        failed_runs=0,
+        start_time=now,
+        end_time=now,
+    )
+
+    analysis = StatisticalAnalyzer().analyze(result)
+
+    assert analysis.mean == pytest.approx(5.5)
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from pgbenchmark.benchmarks import stress
+
+
+@pytest.mark.skipif(not stress._ProcSampler.available(), reason="needs Linux /proc")
+def test_proc_sampler_matches_psutil():
+    sampler = stress._ProcSampler()
+    try:
+        sample = sampler()
+    finally:
+        sampler.close()
+    reference = stress._psutil_sample()
+
+    fields = stress._RESOURCE_DTYPE.names[1:]
+    sample = dict(zip(fields, sample))
+    reference = dict(zip(fields, reference))
+
+    assert len(sample) == len(reference) == len(fields)
+    assert sample["memory_percent"] == pytest.approx(reference["memory_percent"], abs=5)
+    assert sample["disk_read_mb"] == pytest.approx(reference["disk_read_mb"], rel=0.05)
+    assert sample["network_recv_mb"] == pytest.approx(
+        reference["network_recv_mb"], rel=0.05
+    )
+    assert 0.0 <= sample["cpu_percent"] <= 100.0
+
+
+def test_resource_monitoring_records_samples():
+    benchmark = stress.StressBenchmark(
+        {}, stress_config=stress.StressTestConfig(monitor_interval=0.01)
+    )
+    benchmark._start_resource_monitoring()
+    time.sleep(0.1)
+    benchmark._stop_event.set()
+    benchmark._monitor_thread.join()
+
+    data = benchmark.resource_data
+    assert len(data) >= 2
+    assert (data["timestamp"][1:] >= data["timestamp"][:-1]).all()
+
+    summary = benchmark._analyze_resource_data()
+    assert summary["samples"] == len(data)
+    assert summary["cpu_percent"]["p50"] <= summary["cpu_percent"]["max"]
+
+
+def test_resource_data_grows_past_preallocation(monkeypatch):
+    benchmark = stress.StressBenchmark(
+        {},
+        stress_config=stress.StressTestConfig(
+            duration_seconds=0, ramp_up_time=0, ramp_down_time=0, monitor_interval=1
+        ),
+    )
+    monkeypatch.setattr(stress, "_psutil_sample", lambda: (1.0,) * 7)
+    monkeypatch.setattr(
+        stress._ProcSampler, "available", classmethod(lambda cls: False)
+    )
+    monkeypatch.setattr(benchmark._stop_event, "wait", lambda interval: None)
+    ticks = iter(range(1500))
+    monkeypatch.setattr(
+        benchmark._stop_event, "is_set", lambda: next(ticks, None) is None
+    )
+    benchmark._start_resource_monitoring()
+    benchmark._monitor_thread.join()
+
+    assert len(benchmark.resource_data) == 1500
+    assert benchmark.resource_data["cpu_percent"].min() == 1.0
+    assert benchmark._analyze_resource_data()["disk_read_mb"] == 0.0